@@ -0,0 +1,195 @@
+import argparse
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from generate_concepts_seed import BATCH_MARKER, CHECKPOINT_TABLE, RETIRED_SHARD, commit_manifest
+
+DEFAULT_CONNECTIONS = 4
+
+
+def connect(dsn):
+    """Open an autocommit connection with psycopg 3, or psycopg2 if that is what is installed."""
+    try:
+        import psycopg
+    except ImportError:
+        psycopg = None
+    if psycopg is not None:
+        return psycopg.connect(dsn, autocommit=True)
+
+    try:
+        import psycopg2
+    except ImportError:
+        raise SystemExit("apply_seed.py needs a PostgreSQL driver: pip install psycopg (or psycopg2-binary)")
+    connection = psycopg2.connect(dsn)
+    connection.autocommit = True
+    return connection
+
+
+def execute(connection, sql):
+    cursor = connection.cursor()
+    try:
+        cursor.execute(sql)
+        return cursor.fetchall() if cursor.description else []
+    finally:
+        cursor.close()
+
+
+def scan_batches(path):
+    """Index a chunked seed file without loading it: (preamble end, [(batch_id, shard, start, end)]).
+
+    Offsets are byte positions, so workers can read their own batches later.
+    """
+    marker = BATCH_MARKER.encode("utf-8")
+    batches = []
+    preamble_end = None
+    current = None
+    with open(path, "rb") as f:
+        offset = 0
+        for line in f:
+            if line.startswith(marker):
+                if current is not None:
+                    batches.append((*current, offset))
+                elif preamble_end is None:
+                    preamble_end = offset
+                batch_id, _, shard = line[len(marker):].decode("utf-8").rstrip("\r\n").partition(" shard=")
+                current = (batch_id, shard, offset)
+            offset += len(line)
+        if current is not None:
+            batches.append((*current, offset))
+    if preamble_end is None:
+        preamble_end = offset
+    return preamble_end, batches
+
+
+def read_range(path, start, end):
+    with open(path, "rb") as f:
+        f.seek(start)
+        return f.read(end - start).decode("utf-8")
+
+
+def group_by_shard(batches):
+    """Batches per shard in file order; retirements go last, after every other shard."""
+    shards = {}
+    for batch in batches:
+        shards.setdefault(batch[1], []).append(batch)
+    retired = shards.pop(RETIRED_SHARD, [])
+    return list(shards.values()), retired
+
+
+class ApplyProgress:
+    def __init__(self, total):
+        self.total = total
+        self.applied = 0
+        self.failed = []
+        self.lock = threading.Lock()
+
+    def done(self, batch_id, shard):
+        with self.lock:
+            self.applied += 1
+            print(f"[{self.applied}/{self.total}] {batch_id} ({shard})")
+
+    def fail(self, batch_id, shard, error):
+        with self.lock:
+            self.failed.append(batch_id)
+            print(f"FAILED {batch_id} ({shard}): {error}", file=sys.stderr)
+
+
+def apply_shard(dsn, path, batches, progress):
+    """Apply one shard's batches in order on a dedicated connection; stop the shard at the first failure."""
+    connection = connect(dsn)
+    try:
+        for batch_id, shard, start, end in batches:
+            try:
+                # Each batch carries its own BEGIN ... COMMIT and checkpoint insert.
+                execute(connection, read_range(path, start, end))
+            except Exception as error:
+                try:
+                    execute(connection, "ROLLBACK")
+                except Exception:
+                    pass
+                progress.fail(batch_id, shard, error)
+                return
+            progress.done(batch_id, shard)
+    finally:
+        connection.close()
+
+
+def commit_manifests(paths, seed):
+    """Advance each manifest to the pending one generated with seed; return the exit status."""
+    status = 0
+    for path in paths:
+        try:
+            committed = commit_manifest(path, seed)
+        except ValueError as error:
+            print(error, file=sys.stderr)
+            status = 1
+            continue
+        if committed:
+            print(f"Manifest: {path}")
+        else:
+            print(f"No pending manifest for {path}; left as is", file=sys.stderr)
+    return status
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Apply a generated seed script; chunked ones (generate_concepts_seed.py --batch-rows) "
+                    "resume from their checkpoints.")
+    parser.add_argument("seed", help="generated seed script")
+    parser.add_argument("--dsn", default=os.environ.get("SEED_DATABASE_URL"),
+                        help="PostgreSQL connection string (default: $SEED_DATABASE_URL)")
+    parser.add_argument("-c", "--connections", type=int, default=DEFAULT_CONNECTIONS,
+                        help="shards applied at the same time, one connection each (default: %(default)s)")
+    parser.add_argument("--reset", action="store_true",
+                        help="forget this file's checkpoints and apply every batch again")
+    parser.add_argument("--manifest", nargs="+", default=[],
+                        help="manifests to advance once every batch is applied: each <path>.pending generated "
+                             "with this script replaces <path>")
+    args = parser.parse_args(argv)
+    if not args.dsn:
+        parser.error("no database: pass --dsn or set SEED_DATABASE_URL")
+
+    preamble_end, batches = scan_batches(args.seed)
+    if not batches:
+        # A plain script is all preamble: it runs as one implicit transaction.
+        connection = connect(args.dsn)
+        try:
+            execute(connection, read_range(args.seed, 0, preamble_end))
+        finally:
+            connection.close()
+        print(f"Applied {args.seed}")
+        return commit_manifests(args.manifest, args.seed)
+
+    connection = connect(args.dsn)
+    try:
+        execute(connection, read_range(args.seed, 0, preamble_end))
+        if args.reset:
+            ids = ", ".join("'" + batch_id.replace("'", "''") + "'" for batch_id, *_ in batches)
+            execute(connection, f"DELETE FROM {CHECKPOINT_TABLE} WHERE \"BatchId\" IN ({ids})")
+        completed = {batch_id for (batch_id,) in execute(connection, f"SELECT \"BatchId\" FROM {CHECKPOINT_TABLE}")}
+    finally:
+        connection.close()
+
+    pending = [batch for batch in batches if batch[0] not in completed]
+    print(f"{len(batches)} batches, {len(batches) - len(pending)} already applied, {len(pending)} to go")
+    shards, retired = group_by_shard(pending)
+    progress = ApplyProgress(len(pending))
+
+    with ThreadPoolExecutor(max_workers=max(1, args.connections)) as pool:
+        for future in [pool.submit(apply_shard, args.dsn, args.seed, shard, progress) for shard in shards]:
+            future.result()
+
+    if retired and not progress.failed:
+        apply_shard(args.dsn, args.seed, retired, progress)
+
+    if progress.failed:
+        print(f"{len(progress.failed)} batches failed; rerun to resume from the last checkpoint", file=sys.stderr)
+        return 1
+    print(f"Applied {progress.applied} batches")
+    return commit_manifests(args.manifest, args.seed)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,274 @@
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+from generate_concepts_seed import DEFAULT_INPUT, EMPTY_URL, HERE, NO_CONCEPT, NO_DESCRIPTION
+
+DEFAULT_SIZES = (1_000, 100_000, 1_000_000)
+DEFAULT_BASELINE = os.path.join(HERE, "bench_seed_baseline.json")
+DEFAULT_TOLERANCE = 0.25
+SPORT = "Baloncesto"
+CATEGORIES_SQL = os.path.join(HERE, "seed_categories.sql")
+
+# Each case is a command line run against the synthetic catalog ({input})
+# writing to {output}; {work} is a scratch directory for side files. Every
+# case seeds SPORT (update_seed.py passes it itself), so they all do the
+# same work and their timings compare.
+CASES = {
+    "do": ["generate_concepts_seed.py", "{input}", "--mode", "do", "--sport", SPORT, "-o", "{output}"],
+    "update_seed": ["update_seed.py", "{input}", "--index", "{work}/concept_index.tsv", "-o", "{output}"],
+    "set": ["generate_concepts_seed.py", "{input}", "--mode", "set", "--sport", SPORT, "-o", "{output}"],
+    "set-batched": ["generate_concepts_seed.py", "{input}", "--mode", "set", "--sport", SPORT,
+                    "--batch-rows", "500", "-o", "{output}"],
+    "delta": ["generate_concepts_seed.py", "{input}", "--sport", SPORT,
+              "--manifest", "{work}/missing.manifest.json", "--manifest-out", "{work}/out.manifest.json",
+              "-o", "{output}"],
+    "bundle": ["build_seed_bundle.py", f"{SPORT}={{input}}", "-o", "{output}"],
+}
+
+# Cases whose script can run inside one transaction and be rolled back.
+DB_CASES = ("do", "update_seed", "set", "delta")
+
+# Metrics compared against the baseline; output size is recorded but only
+# changes when the SQL does, which the diff already shows.
+TRACKED = ("generate_seconds", "peak_rss_kb", "db_seconds")
+
+# Timings this close are start-up noise on small catalogs, not regressions.
+MIN_SECONDS_DELTA = 0.25
+
+URL_ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_"
+
+
+def _real_catalog():
+    """(category, subcategory) pairs and word banks taken from the bundled catalog."""
+    pairs = set()
+    name_words = set()
+    description_words = []
+    with open(DEFAULT_INPUT, encoding="utf-8") as f:
+        for line in f:
+            parts = line.rstrip("\n").split("\t")
+            if len(parts) < 5:
+                continue
+            pairs.add((parts[0], parts[1]))
+            if parts[2] != NO_CONCEPT:
+                name_words.update(word for word in parts[2].split() if word.isalpha())
+            if parts[3] != NO_DESCRIPTION:
+                description_words.extend(parts[3].split())
+    return sorted(pairs), sorted(name_words), description_words
+
+
+def write_synthetic_catalog(path, rows, seed=0):
+    """Write a headerless TSV shaped like the real one: long Spanish descriptions, youtu.be URLs, placeholders.
+
+    About 2% of rows repeat an earlier concept and 2% are "(Sin conceptos
+    específicos)" lines, so cleaning and dedup do real work.
+    """
+    rng = random.Random(seed)
+    pairs, name_words, description_words = _real_catalog()
+    # Extra subcategories keep category sizes realistic as the catalog grows.
+    subcategories = [(category, f"{subcategory} {index}" if index else subcategory)
+                     for index in range(max(1, rows // 2_000)) for category, subcategory in pairs]
+    previous = []
+
+    with open(path, "w", encoding="utf-8") as f:
+        for number in range(rows):
+            roll = rng.random()
+            if roll < 0.02 and previous:
+                f.write(rng.choice(previous))
+                continue
+
+            category, subcategory = rng.choice(subcategories)
+            if roll < 0.04:
+                f.write(f"{category}\t{subcategory}\t{NO_CONCEPT}\t{NO_DESCRIPTION}\t{EMPTY_URL}\n")
+                continue
+
+            name = " ".join(rng.choice(name_words) for _ in range(rng.randint(1, 4))) + f" {number:x}"
+            if rng.random() < 0.4:
+                description = NO_DESCRIPTION
+            else:
+                start = rng.randrange(len(description_words))
+                length = rng.randint(30, 120)
+                description = " ".join(description_words[start:start + length])
+                if rng.random() < 0.1:
+                    description += " Se conoce como 'pick and roll'."
+            if rng.random() < 0.25:
+                url = EMPTY_URL
+            else:
+                url = EMPTY_URL + "".join(rng.choice(URL_ALPHABET) for _ in range(11))
+
+            line = f"{category}\t{subcategory}\t{name}\t{description}\t{url}\n"
+            f.write(line)
+            if len(previous) < 1_000:
+                previous.append(line)
+
+
+def run_case(case, input_path, output_path, work_dir):
+    """Run one case in a child process; return (seconds, peak RSS in KiB) for that child alone.
+
+    The peak RSS comes from os.wait4, which only exists on Unix; elsewhere
+    it is None and only the time is measured.
+    """
+    argv = [part.format(input=input_path, output=output_path, work=work_dir) for part in CASES[case]]
+    argv[0] = os.path.join(HERE, argv[0])
+    # stderr goes to a file: a pipe nobody reads while waiting could fill up and block the child.
+    with tempfile.TemporaryFile(dir=work_dir) as stderr:
+        start = time.perf_counter()
+        process = subprocess.Popen([sys.executable, *argv], cwd=work_dir, stdout=subprocess.DEVNULL, stderr=stderr)
+        if hasattr(os, "wait4"):
+            _pid, status, usage = os.wait4(process.pid, 0)
+            returncode = os.waitstatus_to_exitcode(status)
+            # ru_maxrss is in KiB on Linux and bytes on macOS.
+            peak_rss_kb = usage.ru_maxrss // 1024 if sys.platform == "darwin" else usage.ru_maxrss
+        else:  # Windows
+            returncode = process.wait()
+            peak_rss_kb = None
+        seconds = time.perf_counter() - start
+        if returncode != 0:
+            stderr.seek(0)
+            raise RuntimeError(f"{case} failed:\n{stderr.read().decode('utf-8', 'replace')}")
+    return seconds, peak_rss_kb
+
+
+def time_in_database(dsn, script_path):
+    """Execute a generated script in a transaction that is rolled back; return the seconds it took.
+
+    The categories (seed_categories.sql) and SPORT are loaded first in the
+    same transaction, untimed, so every script finds what a real seed run
+    would and does its full work on an empty migrated database.
+    """
+    from apply_seed import connect
+
+    with open(CATEGORIES_SQL, encoding="utf-8") as f:
+        categories = f.read()
+    with open(script_path, encoding="utf-8") as f:
+        script = f.read()
+    connection = connect(dsn)
+    try:
+        cursor = connection.cursor()
+        cursor.execute("BEGIN")
+        cursor.execute(categories)
+        cursor.execute(
+            'INSERT INTO "Sports" ("Name", "IsActive", "CreatedAt", "UpdatedAt") '
+            "SELECT %s, true, now(), now() "
+            'WHERE NOT EXISTS (SELECT 1 FROM "Sports" WHERE "Name" = %s)', (SPORT, SPORT))
+        start = time.perf_counter()
+        cursor.execute(script)
+        seconds = time.perf_counter() - start
+        cursor.execute("ROLLBACK")
+        cursor.close()
+    finally:
+        connection.close()
+    return seconds
+
+
+def run_benchmarks(sizes, cases, dsn=None, keep_dir=None, seed=0):
+    """Run every case on every size; scripts are timed in the database only once all of them are generated.
+
+    A child's peak RSS includes this process's memory at the time it is
+    spawned, so the database driver and the scripts it reads must not be
+    loaded here before the generator runs.
+    """
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="bench_seed_") as scratch:
+        work_dir = keep_dir or scratch
+        os.makedirs(work_dir, exist_ok=True)
+        scripts = []
+        for size in sizes:
+            input_path = os.path.join(work_dir, f"catalog_{size}.tsv")
+            write_synthetic_catalog(input_path, size, seed)
+            for case in cases:
+                output_path = os.path.join(work_dir, f"{case}_{size}.sql")
+                seconds, peak_rss_kb = run_case(case, input_path, output_path, work_dir)
+                result = results[f"{case}/{size}"] = {
+                    "generate_seconds": round(seconds, 3),
+                    "output_bytes": os.path.getsize(output_path),
+                }
+                if peak_rss_kb is not None:
+                    result["peak_rss_kb"] = peak_rss_kb
+                if dsn and case in DB_CASES:
+                    scripts.append((case, size, output_path))
+                memory = f"{peak_rss_kb / 1024:8.1f} MiB" if peak_rss_kb is not None else f"{'-':>8}    "
+                print(f"{case:>12} {size:>9} rows: {result['generate_seconds']:8.2f} s "
+                      f"{memory} {result['output_bytes'] / 1024 / 1024:9.1f} MiB out")
+        for case, size, output_path in scripts:
+            seconds = results[f"{case}/{size}"]["db_seconds"] = round(time_in_database(dsn, output_path), 3)
+            print(f"{case:>12} {size:>9} rows: {seconds:8.2f} s in db")
+    return results
+
+
+def find_regressions(results, baseline, tolerance):
+    """Tracked metrics that grew by more than tolerance over the stored baseline.
+
+    Results the baseline has no entry for are reported on stderr and not compared.
+    """
+    regressions = []
+    for key, result in sorted(results.items()):
+        previous = baseline.get(key)
+        if not previous:
+            print(f"warning: no baseline for {key}; not compared", file=sys.stderr)
+            continue
+        for metric in TRACKED:
+            if metric in result and previous.get(metric):
+                ratio = result[metric] / previous[metric]
+                if metric.endswith("_seconds") and result[metric] - previous[metric] < MIN_SECONDS_DELTA:
+                    continue
+                if ratio > 1 + tolerance:
+                    regressions.append((key, metric, previous[metric], result[metric], ratio))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the concept seed generator on synthetic catalogs.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--cases", nargs="+", choices=sorted(CASES), default=list(CASES))
+    parser.add_argument("--dsn", default=os.environ.get("SEED_DATABASE_URL"),
+                        help="also time the generated SQL against this database (schema from the EF migrations); "
+                             "each script runs in a rolled-back transaction (default: $SEED_DATABASE_URL)")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE,
+                        help="stored results to compare against (default: %(default)s)")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="merge this run's results into the baseline file instead of comparing")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="allowed relative growth before a metric counts as a regression (default: %(default)s)")
+    parser.add_argument("--seed", type=int, default=0, help="random seed for the synthetic catalogs")
+    parser.add_argument("--keep", metavar="DIR", help="keep catalogs and generated scripts in DIR")
+    parser.add_argument("--json", metavar="PATH", help="also write this run's results as JSON")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.sizes, args.cases, args.dsn, args.keep, args.seed)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+            f.write("\n")
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f).get("results", {})
+    elif not args.save_baseline:
+        print(f"No baseline at {args.baseline}; record one with --save-baseline", file=sys.stderr)
+        return 1
+
+    if args.save_baseline:
+        baseline.update(results)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump({"machine": platform.platform(), "python": platform.python_version(), "results": baseline},
+                      f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"Saved {len(results)} results to {args.baseline}")
+        return 0
+
+    regressions = find_regressions(results, baseline, args.tolerance)
+    for key, metric, before, after, ratio in regressions:
+        print(f"REGRESSION {key} {metric}: {before} -> {after} ({ratio:.2f}x)", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,139 @@
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+from generate_concepts_seed import (
+    DEFAULT_INPUT,
+    EMITTERS,
+    ManifestDiff,
+    SeedManifest,
+    attach_sport,
+    file_sha256,
+    iter_delta,
+    normalize_key,
+    parse_rows,
+    write_chunked,
+)
+
+DEFAULT_SPORT = "Baloncesto"
+
+
+def parse_catalog_args(values):
+    """Group SPORT=PATH arguments into {sport: [paths]}; a bare PATH belongs to the default sport.
+
+    Sports sharing a (subcategory, concept) such as "Pase" or "Tiro" is
+    normal: the seed tells concepts apart by SportId. Sport names that only
+    differ in case, accents or spacing would seed the same concept twice for
+    what is meant to be one sport, so they raise ValueError; each shard is
+    then deduped on its own and no keys have to be compared across shards.
+    """
+    shards = {}
+    spellings = {}
+    for value in values:
+        sport, separator, path = value.partition("=")
+        if not separator:
+            sport, path = DEFAULT_SPORT, value
+        sport = sport.strip()
+        other = spellings.setdefault(normalize_key(sport), sport)
+        if other != sport:
+            raise ValueError(f"sports '{other}' and '{sport}' differ only in case, accents or spacing")
+        shards.setdefault(sport, []).append(path)
+    return shards
+
+
+def manifest_path_for(manifest_dir, sport):
+    return os.path.join(manifest_dir, f"{sport}.manifest.json")
+
+
+def _count_rows(rows, counter):
+    for row in rows:
+        counter["rows"] += 1
+        yield row
+
+
+def build_shard(sport, paths, mode, shard_path, manifest_dir=None):
+    """Parse, clean, dedupe and serialize one sport's catalogs into shard_path.
+
+    Runs in a worker process. Returns the sport, its number of concepts and,
+    in delta mode, the counts of the manifest diff; the rows themselves only
+    travel through shard_path. The new manifest is left next to the shard
+    until the whole bundle is written.
+    """
+    counter = {"rows": 0}
+    rows = _count_rows(attach_sport(parse_rows(paths), sport), counter)
+    counts = None
+
+    with open(shard_path, "w", encoding="utf-8") as f:
+        if manifest_dir:
+            diff = ManifestDiff(SeedManifest.load(manifest_path_for(manifest_dir, sport)), sport)
+            write_chunked(f, iter_delta(rows, diff))
+        else:
+            write_chunked(f, EMITTERS[mode](rows))
+
+    if manifest_dir:
+        diff.current.save(shard_path + ".manifest.json")
+        counts = (diff.inserted, diff.updated, len(diff.retired()), diff.unchanged)
+
+    return sport, counter["rows"], counts
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build one seed bundle from the concept catalogs of several sports.")
+    parser.add_argument("catalogs", nargs="*", default=[f"{DEFAULT_SPORT}={DEFAULT_INPUT}"],
+                        help="SPORT=PATH catalog files; several files may share a sport (default: %(default)s)")
+    parser.add_argument("--mode", choices=sorted(EMITTERS), default="set")
+    parser.add_argument("--manifest-dir",
+                        help="emit per-sport deltas against <dir>/<sport>.manifest.json instead of full catalogs")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(),
+                        help="worker processes (default: %(default)s)")
+    parser.add_argument("-o", "--output", default="seed_bundle.sql")
+    args = parser.parse_args(argv)
+
+    # Shards are merged in sport order, never completion order, so the
+    # bundle is byte-for-byte reproducible for the same inputs.
+    try:
+        shards = sorted(parse_catalog_args(args.catalogs).items())
+    except ValueError as error:
+        parser.error(str(error))
+    if args.manifest_dir:
+        os.makedirs(args.manifest_dir, exist_ok=True)
+
+    with tempfile.TemporaryDirectory(prefix="seed_bundle_") as work_dir:
+        shard_paths = [os.path.join(work_dir, f"{index:04d}.sql") for index in range(len(shards))]
+
+        with ProcessPoolExecutor(max_workers=max(1, args.jobs)) as pool:
+            futures = [
+                pool.submit(build_shard, sport, paths, args.mode, shard_path, args.manifest_dir)
+                for (sport, paths), shard_path in zip(shards, shard_paths)
+            ]
+            results = [future.result() for future in futures]
+
+        with open(args.output, "w", encoding="utf-8") as out:
+            for (sport, _paths), shard_path, (_sport, concepts, counts) in zip(shards, shard_paths, results):
+                out.write(f"-- Sport: {sport} ({concepts} concepts)\n")
+                with open(shard_path, encoding="utf-8") as shard:
+                    shutil.copyfileobj(shard, out)
+                out.write("\n")
+                if counts:
+                    print(f"{sport}: {counts[0]} inserted, {counts[1]} updated, "
+                          f"{counts[2]} retired, {counts[3]} unchanged")
+
+        if args.manifest_dir:
+            # Pending until apply_seed.py has applied the bundle.
+            digest = file_sha256(args.output)
+            for (sport, _paths), shard_path in zip(shards, shard_paths):
+                pending = manifest_path_for(args.manifest_dir, sport) + SeedManifest.PENDING_SUFFIX
+                SeedManifest.load(shard_path + ".manifest.json").save(pending, digest)
+
+    print(f"Wrote {args.output} ({len(shards)} sports)")
+    if args.manifest_dir:
+        manifests = " ".join(manifest_path_for(args.manifest_dir, sport) for sport, _paths in shards)
+        print(f"Pending manifests: apply with apply_seed.py {args.output} --manifest {manifests}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,194 @@
+import argparse
+import hashlib
+import mmap
+import os
+import sys
+import tempfile
+
+from generate_concepts_seed import DEFAULT_INPUT, HERE, normalize_key, parse_rows
+
+DEFAULT_OUTPUT = os.path.join(HERE, "concept_index.tsv")
+FORMAT = "sportplanner-concept-index"
+VERSION = 1
+
+# Lookup prefixes. Stable tag ids are derived from the normalized concept key,
+# so they survive reordering the catalog; row numbers are the positional tags
+# ExerciseImporter used so far: line numbers of its CSV export, so they are
+# only indexed when that CSV is what the index is built from.
+TAG = "t:"
+NAME = "n:"
+ROW = "r:"
+
+
+def stable_id(normalized_key):
+    """Short, stable tag id for a concept: 16 hex digits of blake2b over its normalized key."""
+    subcategory, name = normalized_key
+    return hashlib.blake2b(f"{subcategory}\x1f{name}".encode("utf-8"), digest_size=8).hexdigest()
+
+
+def _field(value):
+    # The format is one tab-separated entry per line.
+    return value.replace("\t", " ").replace("\r", " ").replace("\n", " ")
+
+
+class ConceptIndexBuilder:
+    """Collect lookups from the row stream and write them as a sorted index file.
+
+    Every lookup resolves to the concept key the generator keeps: the first
+    raw (subcategory, name) seen for a normalized key, as dedupe does. Row
+    tags are only recorded with legacy_rows (see has_importer_rows).
+    """
+
+    def __init__(self, legacy_rows=False):
+        self.legacy_rows = legacy_rows
+        self.concepts = {}
+        self.tags = {}
+        self.rows = []
+
+    def add(self, row):
+        normalized = row.normalized_key
+        if normalized not in self.concepts:
+            self.concepts[normalized] = row.key
+            tag = stable_id(normalized)
+            other = self.tags.setdefault(tag, normalized)
+            if other != normalized:
+                raise ValueError(f"Tag id {tag} collides for {other} and {normalized}")
+        if self.legacy_rows and row.source_row is not None:
+            self.rows.append((row.source_row, normalized))
+
+    def stage(self, rows):
+        """Pipeline stage: index every row on its way through."""
+        for row in rows:
+            self.add(row)
+            yield row
+
+    def entries(self):
+        """Unsorted (lookup, (subcategory, name)) pairs."""
+        for tag, normalized in self.tags.items():
+            key = self.concepts[normalized]
+            yield TAG + tag, key
+            yield NAME + normalized[1], key
+        for number, normalized in self.rows:
+            yield f"{ROW}{number}", self.concepts[normalized]
+
+    def write(self, path):
+        """Write the index; return its body hash, which consumers can use as a cache key."""
+        lines = sorted(f"{_field(lookup)}\t{_field(subcategory)}\t{_field(name)}\n".encode("utf-8")
+                       for lookup, (subcategory, name) in self.entries())
+        digest = hashlib.sha256()
+        for line in lines:
+            digest.update(line)
+        header = f"# {FORMAT} {VERSION} sha256={digest.hexdigest()} concepts={len(self.concepts)} entries={len(lines)}\n"
+
+        directory = os.path.dirname(os.path.abspath(path))
+        with tempfile.NamedTemporaryFile("wb", dir=directory, delete=False) as f:
+            f.write(header.encode("utf-8"))
+            f.writelines(lines)
+        os.replace(f.name, path)
+        return digest.hexdigest()
+
+
+class ConceptIndex:
+    """Read-only lookups on an index file through mmap and binary search, without loading it."""
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self.header = f.readline().decode("utf-8").rstrip("\r\n")
+            self.body_start = f.tell()
+            fields = self.header.split()
+            if fields[:3] != ["#", FORMAT, str(VERSION)]:
+                raise ValueError(f"{path} is not a version {VERSION} concept index")
+            self.meta = dict(field.partition("=")[::2] for field in fields[3:])
+            self.sha256 = self.meta.get("sha256")
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def close(self):
+        self.map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def verify(self):
+        """True when the body still matches the hash in the header."""
+        return hashlib.sha256(self.map[self.body_start:]).hexdigest() == self.sha256
+
+    def _lower_bound(self, target):
+        """Offset of the first line whose lookup is >= target."""
+        data = self.map
+        low, high = self.body_start, len(data)
+        while low < high:
+            middle = (low + high) // 2
+            newline = data.rfind(b"\n", self.body_start, middle)
+            start = newline + 1 if newline != -1 else self.body_start
+            end = data.find(b"\n", start)
+            end = len(data) if end == -1 else end
+            if data[start:data.find(b"\t", start, end)] < target:
+                low = end + 1
+            else:
+                high = start
+        return low
+
+    def lookup(self, lookup):
+        """Every (subcategory, name) stored under a lookup such as 't:<id>', 'n:<name>' or 'r:<row>'."""
+        target = lookup.encode("utf-8")
+        data = self.map
+        found = []
+        position = self._lower_bound(target)
+        while position < len(data):
+            end = data.find(b"\n", position)
+            end = len(data) if end == -1 else end
+            entry, subcategory, name = data[position:end].decode("utf-8").split("\t")
+            if entry != lookup:
+                break
+            found.append((subcategory, name))
+            position = end + 1
+        return found
+
+    def resolve(self, tag):
+        """Concepts for an exercise tag: a stable id, a legacy row number, or a concept name."""
+        tag = tag.strip()
+        for lookup in (TAG + tag.lower(), ROW + tag if tag.isdigit() else None, NAME + normalize_key(tag)):
+            if lookup:
+                found = self.lookup(lookup)
+                if found:
+                    return found
+        return []
+
+
+def has_importer_rows(inputs):
+    """Whether row numbers of these inputs are ExerciseImporter tags: only for a single CSV export."""
+    return len(inputs) == 1 and inputs[0].lower().endswith(".csv")
+
+
+def build_index(inputs, path):
+    builder = ConceptIndexBuilder(has_importer_rows(inputs))
+    for _row in parse_rows(inputs, index=builder):
+        pass
+    return builder, builder.write(path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build or query the concept lookup index used by the exercise importer.")
+    parser.add_argument("inputs", nargs="*", default=[DEFAULT_INPUT])
+    parser.add_argument("-o", "--output", default=DEFAULT_OUTPUT)
+    parser.add_argument("--lookup", nargs="+", metavar="TAG",
+                        help="resolve these tags against an existing index instead of building one")
+    args = parser.parse_args(argv)
+
+    if args.lookup:
+        with ConceptIndex(args.output) as index:
+            for tag in args.lookup:
+                found = index.resolve(tag)
+                print(f"{tag}\t" + ("; ".join(f"{subcategory} / {name}" for subcategory, name in found) or "-"))
+        return 0
+
+    builder, digest = build_index(args.inputs, args.output)
+    print(f"Wrote {args.output}: {len(builder.concepts)} concepts, sha256={digest}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,250 +1,1007 @@
-
+import argparse
+import csv
+import hashlib
+import itertools
+import json
+import os
 import sys
+import unicodedata
 
-data = """
-Técnica Individual	Cambios Dirección	Bote escapatoria	Gesto técnico importante. Cómo se hace: Importante desbloquear la muñeca, para colocar la mano delante del balón, y botar hacia atrás. Pasos cortos y rápidos para poder moverse rápido hacia atrás, con un solo bote. Este bote debo dejarlo libre en la mano, girando el balón en la palma de mano, sin colocar nunca la mano debajo del balón. Cuándo se hace: En situaciones de bloqueo directo cuando me saltan al 2x1 o al show. En situaciones de 2x1 de presión en toda la pista.	https://youtu.be/dZRyT-oHN_g
-Técnica Individual	Cambios Dirección	Bote lateral	Para ser capaz de hacer bien el bote lateral es importante dominar varios aspectos: 1. Desbloquear muñeca para poner la mano en una lateral del balón y botar fuerte 2. Disociar bote y pies. Dar el máximo número de apoyos para avanzar. Girar un poco la cadera y cruzar los pies para llegar lo antes posible al punto de destino. No desplazamientos laterales como en defensa. 3. Dejar el bote libre en la palma de la mano para que gire, sin poner la mano debajo del balón.	https://youtu.be/oPVTlJwTBUU
-Técnica Individual	Cambios Dirección	Cambio debajo de piernas	(Sin descripción específica)	https://youtu.be/dAyxIYeP_PA
-Técnica Individual	Cambios Dirección	Cambio por delante	(Sin descripción específica)	https://youtu.be/
-Técnica Individual	Cambios Dirección	Cambio por detrás	(Sin descripción específica)	https://youtu.be/VVIsHHELmsc
-Técnica Individual	Cambios Dirección	Cambio por detrás velocidad	Cómo se hace: Para hacer este cambio es importante colocar la mano justo detrás del balón. Muchas veces en iniciación se comete el error de poner la mano debajo y no se le da impulso. Importante colocar mano detrás y adelantar el cuerpo. Cuándo se hace: Recurso interesante en campo abierto, contraataque y transiciones. Para evitar un defensor que pretende robar el balón.	https://youtu.be/aco0FWDXBCE
-Técnica Individual	Cambios Dirección	Cambios de dirección	(Sin descripción específica)	https://youtu.be/
-Técnica Individual	Cambios Dirección	Doble cambio. Debajo + delante	(Sin descripción específica)	https://youtu.be/2n_uP5teyUA
-Técnica Individual	Cambios Dirección	Doble cambio. Debajo / detrás	(Sin descripción específica)	https://youtu.be/rQmSQJH269M
-Técnica Individual	Cambios Dirección	Doble cambio. Detras + delante	(Sin descripción específica)	https://youtu.be/yc-biQM9C0Q
-Técnica Individual	Cambios Dirección	Doble por detrás	(Sin descripción específica)	https://youtu.be/CpLmBw6dqCU
-Técnica Individual	Cambios Dirección	Doble. Under drag / delante	(Sin descripción específica)	https://youtu.be/OmhBJSRWMKo
-Técnica Individual	Cambios Dirección	Dobles cambios	(Sin descripción específica)	https://youtu.be/
-Técnica Individual	Cambios Dirección	Entre piernas reverse	Cambio por debajo de las piernas de atrás hacia delante, para volver a la misma mano. Cómo se hace: Pequeño momento de pausa, similar a un stop and go. Con el balón atrás, simulando un pase por detrás de la espalda, se cambia por debajo de las piernas, para que el balón vuelva a la misma mano. Cuándo se hace: En mismas situaciones que un stop and go. De esta manera se hace dudar al defensa, para poder atacar de nuevo. En los cambios defensivos en bloqueo directo es muy utilizado.	https://youtu.be/vatQiG8gUJ4
-Técnica Individual	Cambios Dirección	Finta de penetración	(Sin descripción específica)	https://youtu.be/NFdUx6ivCOg
-Técnica Individual	Cambios Dirección	In & out	(Sin descripción específica)	https://youtu.be/v-g2KdSR3_o
-Técnica Individual	Cambios Dirección	Jab cross	Cambio de dirección de dificultad media. Cómo se hace: Cambio por delante, a la misma vez que se finta con el cuerpo hacia la dirección contraria. Lo más complicado del cambio es coordinar que el balón vaya a un lado y el cuerpo al otro. Importante separar el balón del cuerpo y dejar todo el peso sobre la finta. A partir de ahí un fuerte impulso para sobrepasar al defensor. Cuándo se puede aplicar: El defensor tiene que estar a cierta distancia del atacante. Ideal para 1x1 en carrera o en cambios de asignación tras bloqueos directos cuando un hay un mismatch y el interior queda hundido.	https://youtu.be/1_9nqqanix8
-Técnica Individual	Cambios Dirección	Latigo	(Sin descripción específica)	https://youtu.be/in8XqNvTbzE
-Técnica Individual	Cambios Dirección	Reverso	(Sin descripción específica)	https://youtu.be/M0t_7FnnEtE
-Técnica Individual	Cambios Dirección	Scissors step	(Sin descripción específica)	https://youtu.be/PHGXx4MvmaM
-Técnica Individual	Cambios Dirección	Shot fake hesitation	Vídeo: Xuancar Navarro	https://youtu.be/sgV4rjRJpOM
-Técnica Individual	Cambios Dirección	Shoulder hesitation	Acción similar al stop and go. Cómo se hace: En situaciones de 1x1, girar cadera y pies para orientarnos a línea de banda, con una pequeña parada. Con esto buscamos que el defensor se relaje un segundo. Tras esto, atacar agresivo saliendo con el pie que queda atrás.	https://youtu.be/qKm9FZNuMsQ
-Técnica Individual	Cambios Dirección	Skip Step	Acción de juego sobre bote, que consiste en repetir un pie de apoyo, mientas mantenemos el bote vivo en la palma de la mano, sin colocar la mano debajo. Muy habitual para atacar cambios defensivos, obtener momentos de pausa, y tras bloqueo directo. Es una situación sencilla de entrenar, que puede generar ventajas en 1x1, ya que tras el skip step suele existir un cambio de ritmo.	https://youtu.be/7qjDQAFTvPI
-Técnica Individual	Cambios Dirección	Stop & go	Acción técnica simple que se puede usar en muchos momentos. Cómo se hace: En situaciones donde se ataca con bote, cambiar el ritmo drásticamente. Parar nuestra velocidad, para que el defensor pare con nosotros, y después volver a arrancar para generar una ventaja. Dejar el bote vivo, simular con el cuerpo que ya no se pretende atacar. Cuándo se hace: Muy común en situaciones de bloqueo directo para atacar al jugador grande. En campo abierto para atacar en 1x1.	https://youtu.be/xEB6XKuM3FI
-Técnica Individual	Finalizaciones	Abrazar balón	Finalización sencilla de trabajar y muy útil para anotar en situaciones de actividad defensiva. Cómo se hace: En el inicio del ciclo de pasos, colocar la palma de la mano delante de la pelota. Envolver el balón contra el pecho, protegiendo y evitando que los defensores lo puedan tocar.	https://youtu.be/Yfa-_diETdc
-Técnica Individual	Finalizaciones	Bump Finishing	(Sin descripción específica)	https://youtu.be/vILg36gK4_Q
-Técnica Individual	Finalizaciones	Doble paso rapido	(Sin descripción específica)	https://youtu.be/4DyVSW3hnWY
-Técnica Individual	Finalizaciones	Euro step	Finalización sencilla. Cómo se hace: Cambiar la dirección de los apoyos en la entrada. Importante cambiar de dirección en el segundo apoyo. A veces se cambia mucho en el primero, y el jugador se queda sin fuerza para el segundo. Pequeño momento de pausa después del primer apoyo. El balón puede ir por encima de la cabeza para evitar defensores. Cuándo se hace: Hay varias situaciones: - Meterme entre dos defensores, evitando ayudas defensivas - Contraataque, con la defensa cerca de mí, para que se pase de frenada en el primer apoyo - Atacando una ayuda defensiva - Si lo hago contra un defensor que está en frente de mí, tiene que estar a cierta distancia.	https://youtu.be/Nfp0PGRlfjg
-Técnica Individual	Finalizaciones	Fake spin move	(Sin descripción específica)	https://youtu.be/
-Técnica Individual	Finalizaciones	Finaliza. alrededor cintura	Cómo se hace: En el primer apoyo de la entrada, se pasa el balón alrededor de la cintura, comenzando de atrás hacia delante desde la mano que bota. Es una finalización sencilla, pero requiere un poco de coordinación. Cuándo se hace: Es útil para evitar robos de balón. Cuando el defensor quiere anticiparse e ir a robar, o para meterse entre dos defensores y proteger el balón de esta manera.	https://youtu.be/Z-0414kODIs
-Técnica Individual	Finalizaciones	Finaliza. Aro pasado	(Sin descripción específica)	https://youtu.be/8Frx5HWiekM
-Técnica Individual	Finalizaciones	Finalización tras pase	(Sin descripción específica)	https://youtu.be/
-Técnica Individual	Finalizaciones	Finalizaciones	(Sin descripción específica)	https://youtu.be/
-Técnica Individual	Finalizaciones	Finta de pase	Cómo se hace: Se puede combinar con eurostep, o hacerla de manera independiente. En el primer paso efectuar la finta de pase, y finalizar tras el segundo apoyo. Hay que tener en cuenta varios aspectos: 1. Estirar los brazos al máximo en la finta 2. Mirar hacia donde se finta 3. No hacerlo excesivamente rápido. Cuándo se hace: Buena opción en contraataque y superioridades. Otra opción muy clara, es cuando desbordo en 1x1 y voy hacia canasta contra la ayuda defensiva.	https://youtu.be/4qA1pSBu-_s
-Técnica Individual	Finalizaciones	Floater	Cómo se hace: Por la izquierda normalmente se hace con pérdida de paso. Importante bombear mucho el lanzamiento para evitar defensores. Clave el tacto de balón. Por la derecha se suelen hacer dos apoyos rápidos para acabar lanzando con el apoyo de pierna izquierda. Una de las claves es frenar en el último apoyo para que la última batida sea en vertical, no hacia delante. Cuándo se hace: Se suele hacer para evitar el tapón de jugadores más grandes. Debe existir espacio entre atacante y defensor. Importante frenar la carrera para no seguir hacia delante en el salto.	https://youtu.be/yPEa9apF7Lk
-Técnica Individual	Finalizaciones	Parada dos tiempos + giro	Finalización para fintar el tiro tras 2 apoyos, girar y terminar con la mano contraria. Cómo se hace: Después de marcar los apoyos normales de una entrada, se finta el tiro, levantándolo por encima de la cabeza, se debe girar sobre el pie de pivote, para finalizar con la mano contraria. Importante estar muy flexionado y hacer una buena finta. Cuándo hacerlo: Muy usual que los jugadores diestros lo hagan cuando entran por lado izquierda. El defensor debe estar cerca del atacante, y lateral a este. Con la finta se busca que el defensor salte o se pase de frenada, y conseguir tirar con facilidad tras el giro.	https://youtu.be/ET3AnY0muKE
-Técnica Individual	Finalizaciones	Paradas un tiempo + pivote	(Sin descripción específica)	https://youtu.be/3M51RdkCjHI
-Técnica Individual	Finalizaciones	Paso corto paso largo	(Sin descripción específica)	https://youtu.be/t_ydSXi1Xlk
-Técnica Individual	Finalizaciones	Perdida paso	Cómo se hace: Entrada con un solo apoyo. Saltar sobre la pierna del lado en que se esté botando y terminar con mano contraria. De esta manera la acción es más natural y sencilla. Lanzando con la misma mano, es una acción más complicada de coordinar, y es recomendable para jugadores más expertos. Cuándo se hace: Muy interesante por línea de fondo. El objetivo suele ser sorprender al defensor para evitar el tapón. Por centro, se suele utilizar para evitar a defensores que vienen del lado de ayuda.	https://youtu.be/3XmMCYGztrs
-Técnica Individual	Finalizaciones	Pinoy step	Finalización sencilla en la cual en el primer paso, se realiza una finta de tiro levantando el balón por encima de la cabeza.	https://youtu.be/6rHbBtbsDzY
-Técnica Individual	Finalizaciones	Pro hop	Cómo se hace: Coincidir un último bote fuerte con el paso contrario. A partir de ahí pasar el balón por encima de la cabeza, dar un salto fuerte, y caer en un tiempo. Importante no caer sobre el mismo pie de batida ya que serían pasos. Tras caer, salto con ambos pies juntos para finalizar. Cuándo se hace: Recurso técnico para pasar por el espacio entre dos defensores. Importante pasar balón por encima de la cabeza y dar un salto potente que te permita avanzar.	https://youtu.be/AcCbOGr_40I
-Técnica Individual	Finalizaciones	Slow step finish	Cómo se hace: El primer paso de la finalización, hacia delante con mucha energía. En el segundo apoyo es importante frenar, y hacer un salto vertical lo más alto que se pueda. Con esto, intentamos que nuestro defensor salte antes que nosotros o se pase de frenada, y poder finalizar con un tiro cercano. En ocasiones se busca el contacto con el defensor y se hace similar a la finalización VEER.	https://youtu.be/XkINUe9s_Uk
-Técnica Individual	Finalizaciones	Spin move	Cómo se hace: Entrada en reverso sencilla de efectuar. Para hacerlo bien, es clave hacer coincidir el último bote con el paso contrario. Tras esto, coger el balón con fuerza y girar estando lo más flexionado posible. Se puede dar un apoyo y finalizar o dar dos aprovechando el paso cero. Importante finalizar con la mano contraria para acabar lo más alejado posible de la defensa. Cuándo hacerlo: Para hacer esta entrada el defensor tiene que estar muy cerca del atacante. Lo ideal es hacerlo en carrera cuando el defensor está a un lado del atacante. Una variante a esta finalización es la que hace Tony Parker. En vez de coincidir bote y paso contrario, lo hace tras cambio de dirección por delante.	https://youtu.be/NApZ3_Zqzug
-Técnica Individual	Finalizaciones	Step thru	Cómo se hace: Parada en dos tiempos sobre bote. Tras la parada fintar el tiro, para que la defensa salte o pierda su posición defensiva. Tras ello pivotar sobre el primer apoyo, cruzando el pie, para finalizar. Según el reglamento se puede levantar el pie de pivote para pasar o lanzar.	https://youtu.be/UNZthk3tsZw
-Técnica Individual	Finalizaciones	Swing step	Cómo se hace: Hacer coincidir un último bote fuerte con el apoyo de la pierna contraria. A partir de ahí, llevar el balón por encima de la cabeza, y cruzar el primer paso para cambiar de dirección. El último apoyo hacerlo con fuerza para finalizar. Se puede hacer pasando el balón por encima de la cabeza o por detrás de la espalda. Cuándo se hace: Se suele utilizar para acabar la entrada por el lado contrario por el que se empieza. Útil en contraataque, con bastante espacio entre atacante y defensor. Muy utilizado por jugadores con gran potencia física para aprovechar bien los apoyos.	https://youtu.be/tpXmOT-K-Xk
-Técnica Individual	Finalizaciones	Veer	(Sin descripción específica)	https://youtu.be/sZu7DoMVg1g
-Técnica Individual	Manejo de balón	Bote de velocidad	(Sin descripción específica)	https://youtu.be/8PXFc9SbdLM
-Técnica Individual	Manejo de balón	Bote mano no dominante	(Sin descripción específica)	https://youtu.be/
-Técnica Individual	Manejo de balón	Bote protección	Bote que se realiza para evitar que el defensor pueda robarme el balón. Este bote me permite ver lo que está pasando en la pista, sin riesgo de perder el balón. Cómo se hace: Bote muy bajo, con la mano más alejada del defensor, y colocando mi cuerpo entre balón y defensa. Cuándo se puede hacer: En situaciones de mucha presión del defensor, para ver posibilidades de pase o cambio de dirección. También se suele usar cuando se quiere marcar un sistema, o el jugador con balón está esperando movimientos de sus compañeros. Es importante no abusar de este bote, ya que la defensa quita iniciativa al ataque.	https://youtu.be/Z94GPkvjb6U
-Técnica Individual	Manejo de balón	Bote Uso hemisferios	(Sin descripción específica)	https://youtu.be/jVWhtDN6KSo
-Técnica Individual	Manejo de balón	Disociar bote y visión	(Sin descripción específica)	https://youtu.be/
-Técnica Individual	Manejo de balón	Manejo de balón	(Sin descripción específica)	https://youtu.be/
-Técnica Individual	Manejo de balón	Ritmos de bote	(Sin descripción específica)	https://youtu.be/
-Técnica Individual	Manejo de balón	Tension bote	(Sin descripción específica)	https://youtu.be/
-Técnica Individual	Paradas	Dos tiempos exterior	(Sin descripción específica)	https://youtu.be/iaIDwhAfKO0
-Técnica Individual	Paradas	Dos tiempos interior	(Sin descripción específica)	https://youtu.be/Yk8XWQqxRgo
-Técnica Individual	Paradas	Parada Un tiempo	(Sin descripción específica)	https://youtu.be/Dz4aBGw0UJY
-Técnica Individual	Paradas	Paradas	(Sin descripción específica)	https://youtu.be/
-Técnica Individual	Pase	Finta de pase	(Sin descripción específica)	https://youtu.be/
-Técnica Individual	Pase	Mano a mano	(Sin descripción específica)	https://youtu.be/
-Técnica Individual	Pase	Pase	(Sin descripción específica)	https://youtu.be/
-Técnica Individual	Pase	Pase a poste bajo	Si el atacante no tiene contacto con el defensor = pase directo, fuerte y tenso. Si el atacante está en contacto con el defensor = pase picado. Lejos de la posición del defensor. Opciones para pasar al poste bajo: - Fintas de pase o de tiro - Bote lateral para generar una línea de pase libre. - Pivote para ganar espacio. - Combinación de todas estas opciones.	https://youtu.be/b4VrN0hQ-x8
-Técnica Individual	Pase	Pase de bolos	Pase poco utilizado. Se utiliza en situaciones de contraataque, normalmente tras bote. Es una opción de pase largo, cuando no se tiene mucha fuerza. Cómo se hace: Poniendo la mano debajo del balón, y utilizando el gesto de lanzamiento de bolos.	https://youtu.be/iryQ0qDOadk
-Técnica Individual	Pase	Pase de gancho	(Sin descripción específica)	https://youtu.be/pPG-J-3OqUQ
-Técnica Individual	Pase	Pase por detrás espalda	(Sin descripción específica)	https://youtu.be/AwY3iHeSQ7E
-Técnica Individual	Pase	Pase tras bote	(Sin descripción específica)	https://youtu.be/b8O6W1NOLrY
-Técnica Individual	Pase	Pocket pass	(Sin descripción específica)	https://youtu.be/6hz3uCXGgn8
-Técnica Individual	Poste bajo	1 bote + reverso	(Sin descripción específica)	https://youtu.be/xzV4qF8vWFs
-Técnica Individual	Poste bajo	Back down	(Sin descripción específica)	https://youtu.be/g0uODB3wzbo
-Técnica Individual	Poste bajo	Centro + fondo	(Sin descripción específica)	https://youtu.be/tGC0oXxiUjg
-Técnica Individual	Poste bajo	Dos apoyos + extension	(Sin descripción específica)	https://youtu.be/yrL2TZR0bgw
-Técnica Individual	Poste bajo	Drop step	(Sin descripción específica)	https://youtu.be/Df8bnmzT4mE
-Técnica Individual	Poste bajo	Duck in	Acción de ganar espacio cerca del aro, para recibir y jugar un 1x1. Lo suelen hacer jugadores interiores, pero lo puede jugar cualquier jugador. Consiste en colocarse delante del defensor, flexionado, con un centro de gravedad bajo, y empujar hacia atrás, con el objetivo de recibir cerca de canasta.	https://youtu.be/q2rj_Fy91w0
-Técnica Individual	Poste bajo	Fade away	(Sin descripción específica)	https://youtu.be/gU956iTOIFU
-Técnica Individual	Poste bajo	Fondo + centro	(Sin descripción específica)	https://youtu.be/
-Técnica Individual	Poste bajo	Gancho	(Sin descripción específica)	https://youtu.be/jDS3oB5ROsk
-Técnica Individual	Poste bajo	Inverted Up & Under	(Sin descripción específica)	https://youtu.be/NozW-ZLkWKI
-Técnica Individual	Poste bajo	Mirotic up & under	Movimiento clásico de Mirotic, con el que consigue generar muchas ventajas. Cómo se hace: Tras recibir en poste bajo, y contactar con el defensor, gira simulando un fade away, para fintar el tiro, y pivotar hacia el aro. Importante subir el balón por encima de la cabeza para que el defensor se crea la finta, y estar muy flexionado. Se repiten dos pivotes sobre el mismo pie, el primero para fintar el tiro, y el segundo para atacar al aro tras la finta.	https://youtu.be/6KaglEDamHY
-Técnica Individual	Poste bajo	Nowitzki shot	(Sin descripción específica)	https://youtu.be/z_ISAZ5oF0g
-Técnica Individual	Poste bajo	Paradas + pivotes	(Sin descripción específica)	https://youtu.be/
-Técnica Individual	Poste bajo	Pivote exterior	Consiste en pivotar para encarar el aro. Normalmente, se pivota sobre el pie que está más cerca del defensor, para separarme de él y generar espacio. Tras esto es posible tirar, leer lo que sucede en la pista o atacar con bote. Cuidado con no hacer pasos. Al pivotar para encarar el aro, ya hemos movido el pie de pivote. No podré cambiarlo y salir sobre la otra pierna.	https://youtu.be/ojsgOPPRIOQ
-Técnica Individual	Poste bajo	Poste bajo	(Sin descripción específica)	https://youtu.be/
-Técnica Individual	Poste bajo	Quick spin	(Sin descripción específica)	https://youtu.be/xgwTC0PBAz4
-Técnica Individual	Poste bajo	Shimmy hook	(Sin descripción específica)	https://youtu.be/OzBEfFQ1jhQ
-Técnica Individual	Poste bajo	Shoulder spin	(Sin descripción específica)	https://youtu.be/z46VYVbd31o
-Técnica Individual	Poste bajo	Up & under	Gesto técnico en poste bajo. Cómo se hace: Es un gesto sencillo. Consiste en fintar el tiro, para después cruzar el pie y terminar con una finalización. Importante estar flexionado, levantar el balón por encima de la cabeza, y mirar al aro, para que el defensor se crea la finta. Tras esto, cruzar el pie, para terminar.	https://youtu.be/lE7ahKxdUWk
-Técnica Individual	Salidas	Abierta mano cambiada	Esta salida es una alternativa sencilla para no cometer pasos en salidas abiertas. Cómo se hace: Lanzar el balón con la mano contraria a la del primer paso de salida. Importante lanzarla fuerte y hacia delante. Una opción para atacar closeout, es colocar las manos como si fueras a tirar, y en ese momento lanzar la pelota hacia delante con la mano de tiro. Cuándo se hace: Para atacar closeout, en situaciones de salidas de bloqueo indirecto, o cualquier situación en las que quiera hacer una salida abierta sin riesgo de hacer pasos.	https://youtu.be/H4w7YmP7YbE
-Técnica Individual	Salidas	Finta de salida	Finta de salida o jab step. Es un movimiento simple, que se utiliza para generar pequeñas ventajas en el 1x1. Finta de salida abierta, con un movimiento corto y explosivo para acabar haciendo una salida cruzada.	https://youtu.be/Cl3DnfdbE90
-Técnica Individual	Salidas	Finta salida abierta + cambio delante	(Sin descripción específica)	https://youtu.be/MR2O1U4yCII
-Técnica Individual	Salidas	Karate kid	(Sin descripción específica)	https://youtu.be/
-Técnica Individual	Salidas	Negative step	(Sin descripción específica)	https://youtu.be/qO7xfSPpt14
-Técnica Individual	Salidas	Parada 1T + salida cruzada. Causeur	Cómo se hace: Control de balón sobre el pie exterior, y parada en un tiempo posterior. Este pequeño salto que realiza antes de la parada le permite ganar tiempo para leer el juego y ganar explosividad. Tras esto salida cruzada a izquierda o derecha. Gran recurso técnico. Video: Coach Sergio Lopez.	https://youtu.be/1VmKJAkrWnI
-Técnica Individual	Salidas	Salida abierta	(Sin descripción específica)	https://youtu.be/
-Técnica Individual	Salidas	Salida abierta con bote previo	Salida que consiste en dar un bote bajo y vertical, para poder liberar los pasos, y hacer una salida abierta sin riesgo de cometer pasos de salida. Se suele hacer precedida de una finta de tiro, desbloqueo de muñeca, para hacer un bote muy bajo de adelante hacia atrás, para colocar la mano justo detrás del balón y poder atacar agresivo hacia delante.	https://youtu.be/I8qtq2upI3Q
-Técnica Individual	Salidas	Salida cruzada	(Sin descripción específica)	https://youtu.be/mHdMmlyK5CY
-Técnica Individual	Salidas	Salida cruzada + cambio por detras	(Sin descripción específica)	https://youtu.be/3VAdZnpUL_I
-Técnica Individual	Salidas	Salida en reverso	(Sin descripción específica)	https://youtu.be/
-Técnica Individual	Salidas	Salidas	(Sin descripción específica)	https://youtu.be/
-Técnica Individual	Tiro	Finta de tiro	(Sin descripción específica)	https://youtu.be/x9w5uQ_H3zM
-Técnica Individual	Tiro	Hop	Gesto importante para conseguir fluidez en el tiro. Consiste en una pequeña parada en un tiempo, antes de recibir el balón. Este gesto nos ayuda a transmitir la fuerza de las piernas al lanzamiento y de esta manera hacer un tiro biomecánicamente más eficiente. Esta parada, se utiliza cuando el tirador tiene poco tiempo para armar el lanzamiento. También nos permite salir cruzado hacia ambos lados, lo que es una gran ventaja.	https://youtu.be/F4Wm73EVWSs
-Técnica Individual	Tiro	Inverted drag	(Sin descripción específica)	https://youtu.be/Os4Irqju6RI
-Técnica Individual	Tiro	Mecanica tiro	(Sin descripción específica)	https://youtu.be/
-Técnica Individual	Tiro	Punch drag	Es una acción para generarse espacio y tirar tras bote. Consiste en adelantar el paso del mismo lado del bote. Tras esto rápidamente retroceder ese mismo paso, para generar espacio para tirar. Para tener éxito, hay que coincidir un bote fuerte y agresivo con ese último paso, para que el defensor se vaya un poco para atrás.	https://youtu.be/oq97z_vcGZ8
-Técnica Individual	Tiro	Selección de tiro	(Sin descripción específica)	https://youtu.be/
-Técnica Individual	Tiro	Side step	(Sin descripción específica)	https://youtu.be/Tf2qmZF9zgs
-Técnica Individual	Tiro	Step back	Cómo se hace: Coincidir bote y paso contrario muy agresivo, para que el defensor vaya un poco hacia atrás. Tras esto un pequeño salto hacia atrás o lateral para conseguir espacio suficiente para tirar. Importante que el salto no sea muy grande, para no perder fuerza en las piernas para el siguiente salto. Esta situación es más cómoda para los jugadores cuando la hacen hacia lado NO dominante. En jugadores diestros, es un gesto natural botando hacia izquierda.	https://youtu.be/xxoC4LrVlV0
-Técnica Individual	Tiro	Tiro	(Sin descripción específica)	https://youtu.be/
-Técnica Individual	Tiro	Tiro libre	(Sin descripción específica)	https://youtu.be/OPTmkIjH0OQ
-Técnica Individual	Tiro	Tiro tras bote	(Sin descripción específica)	https://youtu.be/
-Técnica Individual	Tiro	Under drag	Gesto técnico para generarse un espacio para tirar tras bote. Cómo se hace: Cambio por debajo de la pierna del lado de bote, yendo de adelante hacia atrás. Importante estar muy flexionado, para que la defensa piense que el atacante sigue la carrera hacia el aro. Tras este cambio, parada en uno o dos tiempos para poder tirar. Cuándo: Para hacer este gesto, el defensor en un inicio debe estar cerca, para caer en la finta del under drag.	https://youtu.be/vUV2fjIXBFU
-Técnica Individual	Tiro	Volumen de tiro	(Sin descripción específica)	https://youtu.be/
-Táctica Individual	Juego con balón	1x1	(Sin descripción específica)	https://youtu.be/
-Táctica Individual	Juego con balón	1x1 en carrera	(Sin descripción específica)	https://youtu.be/
-Táctica Individual	Juego con balón	Atacar closeout	(Sin descripción específica)	https://youtu.be/yljitJ1tP8w
-Táctica Individual	Juego con balón	Atacar la recepción. Estampida	(Sin descripción específica)	https://youtu.be/RyMeBjwcP7Y
-Táctica Individual	Juego con balón	Penetrar y pasar	Acción básica del juego colectivo. Consiste en atacar 1x1 para fijar o atraer defensores, y pasar el balón a un jugador liberado.	https://youtu.be/57vVI-ZUxDY
-Táctica Individual	Juego con balón	Si def esta cerca ataco	(Sin descripción específica)	https://youtu.be/
-Táctica Individual	Juego con balón	Si def esta lejos tiro	(Sin descripción específica)	https://youtu.be/
-Táctica Individual	Juego sin balon	Cambio chip defensa/ataque	(Sin descripción específica)	https://youtu.be/
-Táctica Individual	Juego sin balon	Corte a canasta	(Sin descripción específica)	https://youtu.be/xjcFgK4ch84
-Táctica Individual	Juego sin balon	Danilovic cut	Corte a canasta que se realiza desde la esquina del lado fuerte del ataque. En situaciones donde el defensor está mirando el balón, el atacante realiza un corte agresivo por delante de su defensa, para adelantarse y conseguir canasta. Corte típico, en situaciones de cuernos o similares.	https://youtu.be/wMB9unuRw4I
-Táctica Individual	Juego sin balon	JSB ante 1x1. Exterior	(Sin descripción específica)	https://youtu.be/jSXi23WvkBQ
-Táctica Individual	Juego sin balon	JSB ante 1x1. Interior	(Sin descripción específica)	https://youtu.be/HWwa9luUgG0
-Táctica Individual	Juego sin balon	JSB para recibir	(Sin descripción específica)	https://youtu.be/Qro2_nQWk-w
-Táctica Individual	Juego sin balon	Juego sin balón	(Sin descripción específica)	https://youtu.be/
-Táctica Individual	Juego sin balon	Ocupación espacios	(Sin descripción específica)	https://youtu.be/
-Táctica Individual	Juego sin balon	Pasar y moverse	(Sin descripción específica)	https://youtu.be/
-Táctica Individual	Juego sin balon	Puerta atrás	Jugada ofensiva en la que un jugador en el perímetro se aleja de la canasta, arrastrando al defensor y luego de repente corta a la canasta detrás del defensor para dar un pase. Importante acercarme al pasador para engañar al defensor, y tras esto hacer un cambio de ritmo fuerte en dirección a la canasta.	https://youtu.be/QklsVZIBu6k
-Táctica Individual	Juego sin balon	Rebote ofensivo	(Sin descripción específica)	https://youtu.be/
-Táctica Individual	Juego sin balon	Respeto espacios	(Sin descripción específica)	https://youtu.be/
-Táctica Colectiva	Bloqueo directo	Atacar cambio defensivo	(Sin descripción específica)	https://youtu.be/
-Táctica Colectiva	Bloqueo directo	Atacar lado no bloqueo	(Sin descripción específica)	https://youtu.be/jIRRUHfrxGA
-Táctica Colectiva	Bloqueo directo	Bloqueador	(Sin descripción específica)	https://youtu.be/
-Táctica Colectiva	Bloqueo directo	Bloqueo directo	(Sin descripción específica)	https://youtu.be/
-Táctica Colectiva	Bloqueo directo	Boomerang pass	Acción táctica ante cambio en bloqueo directo. El jugador con balón pasa a un compañero tras el bloqueo directo, para inmediatamente volver a recibir y atacar en 1x1 al cambio defensivo. Es muy común, que tras el cambio, el jugador grande, se relaje tras el pase del atacante. El boomerang pass, nos da la opción de castigar este 1x1. Es interesante que el receptor del pase, se vaya un poco hacia atrás para atacar en carrera al defensor.	https://youtu.be/xnbwnQn4ENk
-Táctica Colectiva	Bloqueo directo	Bote atras + giro + pase	(Sin descripción específica)	https://youtu.be/VQuMBKdeqMo
-Táctica Colectiva	Bloqueo directo	Fintar bloqueo	Slip o fintar bloqueo. Se trata de una acción muy común en la actualidad. Se trata de fintar un bloqueo directo, para que se active la defensa del bloqueo y atacar 1x1 o el pase a jugador que bloquea. Antes de que llegue a existir el contacto entre bloqueador y defensor, este se aleja rápido para crear una ventaja.	https://youtu.be/uwikTfaNRh0
-Táctica Colectiva	Bloqueo directo	Gortat screen	(Sin descripción específica)	https://youtu.be/CfFDgaYbSSM
-Táctica Colectiva	Bloqueo directo	In the jail	(Sin descripción específica)	https://youtu.be/XBJ2NLtVmxM
-Táctica Colectiva	Bloqueo directo	Meter def en el bloqueo con bote	(Sin descripción específica)	https://youtu.be/
-Táctica Colectiva	Bloqueo directo	Pick and pop	(Sin descripción específica)	https://youtu.be/omGrFbU0ls4
-Táctica Colectiva	Bloqueo directo	Pick and roll	(Sin descripción específica)	https://youtu.be/
-Táctica Colectiva	Bloqueo directo	preuba tag1	(Sin descripción específica)	https://youtu.be/
-Táctica Colectiva	Bloqueo directo	Repick	Situación táctica, que consiste en volver a bloquear a un defensor después de un primer bloqueo. Normalmente se hace cuando el defensor decide pasar por debajo o cuando no hay contacto en el primer bloqueo. El bloqueador debe girar su cuerpo, para poner el 2º bloqueo un poco más cerca del aro. El jugador con balón, debe tener pausa en el bote, dejar pasar al defensor, y cambiar rápidamente de dirección.	https://youtu.be/UhfqL1GDhwk
-Táctica Colectiva	Bloqueo directo	Roll corto	(Sin descripción específica)	https://youtu.be/GAIpEDqYdQM
-Táctica Colectiva	Bloqueo directo	Snake	(Sin descripción específica)	https://youtu.be/B1fRnRtklwc
-Táctica Colectiva	Bloqueo directo	Split	(Sin descripción específica)	https://youtu.be/hE5FU07pPo0
-Táctica Colectiva	Bloqueo directo	tag 2	(Sin descripción específica)	https://youtu.be/
-Táctica Colectiva	Bloqueo directo	tag 3	(Sin descripción específica)	https://youtu.be/
-Táctica Colectiva	Bloqueo directo	Triangulación	(Sin descripción específica)	https://youtu.be/
-Táctica Colectiva	Bloqueo indirecto	Abrise si def recorta	(Sin descripción específica)	https://youtu.be/3kfhJX1Zh_Y
-Táctica Colectiva	Bloqueo indirecto	Bloqueo Ciego	Video: Juan Carlos Garcia	https://youtu.be/8Zi6FHvF1yM
-Táctica Colectiva	Bloqueo indirecto	Bloqueo indirecto	(Sin descripción específica)	https://youtu.be/
-Táctica Colectiva	Bloqueo indirecto	Continuacion del bloqueador	(Sin descripción específica)	https://youtu.be/
-Táctica Colectiva	Bloqueo indirecto	Cross screen	Bloqueo que se hace paralelo a línea de fondo. Normalmente de un jugador exterior a un interior, para recibir en poste bajo.	https://youtu.be/7akhpHLWBRU
-Táctica Colectiva	Bloqueo indirecto	Flare screen	(Sin descripción específica)	https://youtu.be/T4iyYag8974
-Táctica Colectiva	Bloqueo indirecto	Hammer screen	(Sin descripción específica)	https://youtu.be/hWDBFIfFTG0
-Táctica Colectiva	Bloqueo indirecto	Juego sin balon. Meter def en bi	(Sin descripción específica)	https://youtu.be/
-Táctica Colectiva	Bloqueo indirecto	Pin down	(Sin descripción específica)	https://youtu.be/wTVBv-Nz_lQ
-Táctica Colectiva	Bloqueo indirecto	Ricky screen	Acción en la que un jugador sin balón recibe de manera consecutiva dos bloqueos indirectos en sentido opuesto por parte de un mismo jugador. El jugador que tiene intención de recibir, utiliza un bloqueo indirecto y aprovecha la inercia de su defensor al perseguirle para cambiar de sentido bruscamente	https://youtu.be/zUbajGCPafQ
-Táctica Colectiva	Bloqueo indirecto	Rizo	(Sin descripción específica)	https://youtu.be/co7e9Iwi_50
-Táctica Colectiva	Bloqueo indirecto	Stagger	(Sin descripción específica)	https://youtu.be/cfDWOPP5wdw
-Táctica Colectiva	Bloqueo indirecto	Ucla	(Sin descripción específica)	https://youtu.be/Yo-XLUZTtlQ
-Táctica Colectiva	Contrataque	Atacar por centro	(Sin descripción específica)	https://youtu.be/
-Táctica Colectiva	Contrataque	Calles contrataque	(Sin descripción específica)	https://youtu.be/
-Táctica Colectiva	Contrataque	Contrataque	(Sin descripción específica)	https://youtu.be/_lpdZPl5B_8
-Táctica Colectiva	Contrataque	CTQ. Atacar por banda	(Sin descripción específica)	https://youtu.be/
-Táctica Colectiva	Contrataque	Pase apertura	(Sin descripción específica)	https://youtu.be/mq50jydCwQ0
-Táctica Colectiva	Contrataque	Superioridades	(Sin descripción específica)	https://youtu.be/
-Táctica Colectiva	Contrataque	Touchdown pass	(Sin descripción específica)	https://youtu.be/gxbDyyUShnM
-Táctica Colectiva	Contrataque	Trailer	(Sin descripción específica)	https://youtu.be/
-Táctica Colectiva	Contrataque	Transicion	(Sin descripción específica)	https://youtu.be/
-Táctica Colectiva	Juego colectivo	Ataque a zona	(Sin descripción específica)	https://youtu.be/
-Táctica Colectiva	Juego colectivo	Extra pass	(Sin descripción específica)	https://youtu.be/gAaXFvqQQ70
-Táctica Colectiva	Juego colectivo	Higw-low	(Sin descripción específica)	https://youtu.be/O_l27IMQ8pc
-Táctica Colectiva	Juego colectivo	Inversión de balón	(Sin descripción específica)	https://youtu.be/
-Táctica Colectiva	Juego colectivo	Ocupacion esquina	(Sin descripción específica)	https://youtu.be/
-Táctica Colectiva	Juego colectivo	Pasar y cortar	(Sin descripción específica)	https://youtu.be/eFjAAlEegIU
-Táctica Colectiva	Juego colectivo	Remplazar posiciones	(Sin descripción específica)	https://youtu.be/
-Táctica Colectiva	Juego colectivo	Repost	Situación táctica que consiste en volver a jugar un balón interior, después de que el jugador interior saque el balón fuera. Normalmente el defensor interior se suele relajar tras el pase hacia afuera, y es un buen momento para que el atacante gane la posición más cerca del aro, y pueda volver a recibir.	https://youtu.be/-Wj8QcTeUJY
-Táctica Colectiva	Juego colectivo	Salida de presión	(Sin descripción específica)	https://youtu.be/
-Táctica Colectiva	Mano a mano	Fintar mano a mano + cambio dirección	(Sin descripción específica)	https://youtu.be/
-Táctica Colectiva	Mano a mano	Mano a mano	(Sin descripción específica)	https://youtu.be/
-Táctica Colectiva	Mano a mano	Mano a mano + atacar	(Sin descripción específica)	https://youtu.be/lpd_sfRcivg
-Táctica Colectiva	Mano a mano	Puerta atrás mano a mano	(Sin descripción específica)	https://youtu.be/kcgcsvySCZ8
-Táctica Colectiva	Mano a mano	Romper mano a mano con bote	(Sin descripción específica)	https://youtu.be/6YE_NusAtlw
-Táctica Colectiva	Mano a mano	Tiro tras mano a mano	(Sin descripción específica)	https://youtu.be/yZxWEhWDBoo
-Estrategia	Conceptos de juego	(Sin conceptos específicos)	(Sin descripción específica)	https://youtu.be/
-Estrategia	Fondos/Bandas	(Sin conceptos específicos)	(Sin descripción específica)	https://youtu.be/
-Estrategia	Set VS Individual	(Sin conceptos específicos)	(Sin descripción específica)	https://youtu.be/
-Estrategia	Set VS Zona	(Sin conceptos específicos)	(Sin descripción específica)	https://youtu.be/
-Estrategia	Situaciones especiales ataque	ATO. Saras FCB. Iverson, UCLA, postup	(Sin descripción específica)	https://youtu.be/
-Estrategia	Transición ofensiva	(Sin conceptos específicos)	(Sin descripción específica)	https://youtu.be/
-"""
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_INPUT = os.path.join(HERE, "conceptos_baloncesto.tsv")
+# Duplicate pairs reviewed and kept on purpose, in the duplicate report's format.
+DEFAULT_ACCEPTED_DUPLICATES = os.path.join(HERE, "seed_duplicates_accepted.json")
 
-with open("seed_concepts.sql", "w", encoding="utf-8") as f:
-    f.write("DO $$\n")
-    f.write("DECLARE\n")
-    f.write("    v_cat_id INT;\n")
-    f.write("BEGIN\n")
+NO_CONCEPT = "(Sin conceptos específicos)"
+NO_DESCRIPTION = "(Sin descripción específica)"
+EMPTY_URL = "https://youtu.be/"
 
-    seen = set()
+# Output is flushed to disk in chunks of roughly this many characters.
+WRITE_CHUNK_SIZE = 64 * 1024
 
-    for line in data.strip().split('\n'):
-        parts = line.split('\t')
-        if len(parts) < 5:
-            continue
-        
-        category = parts[0].strip()
-        subcategory = parts[1].strip()
-        concept = parts[2].strip()
-        description = parts[3].strip()
-        url = parts[4].strip()
-
-        if concept == "(Sin conceptos específicos)":
+# CSV exports (e.g. "Conceptos.Basquet.v3 - nuevo3.csv", the file
+# tools/ExerciseImporter reads) carry a header row; columns are located by
+# name so extra or reordered columns do not matter.
+CSV_COLUMNS = {
+    "category": ("categoria",),
+    "subcategory": ("subcategoria",),
+    "concept": ("concepto",),
+    "description": ("descripcion",),
+    "url": ("url", "video", "enlace", "link"),
+}
+
+
+def sql_literal(value):
+    """Quote a value as a SQL string literal, or NULL when missing."""
+    if value is None:
+        return "NULL"
+    return "'" + value.replace("'", "''") + "'"
+
+
+def normalize_key(text):
+    """Fold case and accents and collapse whitespace: "Juego sin  Balón" -> "juego sin balon"."""
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    stripped = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return " ".join(stripped.split())
+
+
+def _csv_column_map(header):
+    """Map our field names to column indexes of a CSV header row."""
+    folded = [normalize_key(name) for name in header]
+    columns = {}
+    for field, candidates in CSV_COLUMNS.items():
+        for index, name in enumerate(folded):
+            if any(name.startswith(candidate) for candidate in candidates):
+                columns[field] = index
+                break
+    missing = {"subcategory", "concept"} - columns.keys()
+    if missing:
+        raise ValueError(f"CSV header is missing required columns: {', '.join(sorted(missing))}")
+    return columns
+
+
+class SeedRow:
+    """One concept on its way from the catalog to the seed script.
+
+    Stages mutate rows in place and pass them along, so adding a column is a
+    single pass over the records rather than a rewrite of the generated SQL.
+    """
+
+    __slots__ = ("category", "subcategory", "name", "description", "url", "sport", "extra", "source_row")
+
+    def __init__(self, category, subcategory, name, description=None, url=None, sport=None, extra=(),
+                 source_row=None):
+        self.category = category
+        self.subcategory = subcategory
+        self.name = name
+        self.description = description
+        self.url = url
+        self.sport = sport
+        # Additional ("Column", value) pairs written after the standard columns.
+        self.extra = extra
+        # 1-based line (after any CSV header) across all inputs; for the importer CSV, its tag numbers.
+        self.source_row = source_row
+
+    @property
+    def key(self):
+        return (self.subcategory, self.name)
+
+    @property
+    def normalized_key(self):
+        return (normalize_key(self.subcategory), normalize_key(self.name))
+
+    @property
+    def manifest_key(self):
+        """(parent category, subcategory, name): where the concept sits in the category tree."""
+        return (self.category, self.subcategory, self.name)
+
+    def __repr__(self):
+        return f"SeedRow({self.subcategory!r}, {self.name!r})"
+
+
+def sql_value(value):
+    """Render a Python value as a SQL literal."""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, int):
+        return str(value)
+    return sql_literal(value)
+
+
+def read_tsv(path):
+    """Yield (category, subcategory, concept, description, url, line) from a headerless TSV.
+
+    Returns the number of lines in the file, skipped ones included.
+    """
+    number = 0
+    with open(path, encoding="utf-8-sig") as f:
+        for number, line in enumerate(f, 1):
+            parts = line.rstrip("\r\n").split('\t')
+            if len(parts) < 5:
+                continue
+            yield parts[0], parts[1], parts[2], parts[3], parts[4], number
+    return number
+
+
+def read_csv(path):
+    """Yield (category, subcategory, concept, description, url, line) from a CSV with a header row.
+
+    line is where the record starts, counting the lines after the header
+    from 1: the number ExerciseImporter uses as an exercise tag. Returns the
+    number of lines after the header.
+    """
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return 0
+        columns = _csv_column_map(header)
+        header_lines = reader.line_num
+
+        def field(row, name):
+            index = columns.get(name)
+            return row[index] if index is not None and index < len(row) else ""
+
+        start = reader.line_num
+        for row in reader:
+            number = start - header_lines + 1
+            start = reader.line_num
+            if not any(row):
+                continue
+            yield (field(row, "category"), field(row, "subcategory"), field(row, "concept"),
+                   field(row, "description"), field(row, "url"), number)
+        return reader.line_num - header_lines
+
+
+def _offset_lines(records, offset):
+    """Shift the line numbers of a reader's records; return the reader's line count."""
+    while True:
+        try:
+            *record, number = next(records)
+        except StopIteration as done:
+            return done.value or 0
+        yield (*record, offset + number)
+
+
+def read_records(paths):
+    """Lazily chain the raw records of every input file, in order, numbering lines across files."""
+    offset = 0
+    for path in paths:
+        reader = read_csv if path.lower().endswith(".csv") else read_tsv
+        offset += yield from _offset_lines(reader(path), offset)
+
+
+def clean_field(text):
+    """Collapse every run of whitespace, line breaks included, into one space.
+
+    Quoted CSV fields can contain newlines; names end up in "--" comments and
+    batch marker lines of the generated SQL, where a line break would let the
+    rest of the field run as a statement.
+    """
+    return " ".join(text.split())
+
+
+def clean_records(records):
+    """Clean fields, drop placeholder concepts and build SeedRows with None for placeholder values."""
+    for category, subcategory, concept, description, url, source_row in records:
+        category = clean_field(category)
+        subcategory = clean_field(subcategory)
+        concept = clean_field(concept)
+        description = clean_field(description)
+        url = clean_field(url)
+
+        if not concept or concept == NO_CONCEPT:
             continue
 
-        # Deduplicate
-        key = (subcategory, concept)
-        if key in seen:
+        if description == NO_DESCRIPTION or not description:
+            description = None
+
+        if url == EMPTY_URL or not url:
+            url = None
+
+        yield SeedRow(category, subcategory, concept, description, url, source_row=source_row)
+
+
+def dedupe(rows, variants=None):
+    """Keep the first row for each (subcategory, concept) pair, compared by normalized key.
+
+    Spelling variants such as "Juego sin balon" / "Juego sin balón" count as
+    the same concept; when a variants list is given, each dropped variant is
+    recorded there as (kept_key, dropped_key), which means keeping the first
+    spelling of every concept. Without one, only a 16-byte digest of each
+    normalized key is kept.
+    """
+    if variants is None:
+        seen = set()
+        for row in rows:
+            digest = key_digest(row.normalized_key)
+            if digest not in seen:
+                seen.add(digest)
+                yield row
+        return
+
+    kept_keys = {}
+    for row in rows:
+        normalized = row.normalized_key
+        kept = kept_keys.get(normalized)
+        if kept is not None:
+            if kept != row.key:
+                variants.append((kept, row.key))
             continue
-        seen.add(key)
-
-        # Clean data
-        if description == "(Sin descripción específica)":
-            description = "NULL"
-        else:
-            description = f"'{description.replace("'", "''")}'"
-        
-        if url == "https://youtu.be/" or not url:
-            url = "NULL"
-        else:
-            url = f"'{url.replace("'", "''")}'"
-
-        concept_safe = concept.replace("'", "''")
-        subcategory_safe = subcategory.replace("'", "''")
-
-        f.write(f"    -- {concept}\n")
-        f.write(f"    SELECT \"Id\" INTO v_cat_id FROM \"ConceptCategories\" WHERE \"Name\" = '{subcategory_safe}' LIMIT 1;\n")
-        f.write(f"    IF v_cat_id IS NOT NULL THEN\n")
-        f.write(f"        INSERT INTO \"SportConcepts\" (\"Name\", \"Description\", \"Url\", \"ConceptCategoryId\", \"IsActive\")\n")
-        f.write(f"        SELECT '{concept_safe}', {description}, {url}, v_cat_id, true\n")
-        f.write(f"        WHERE NOT EXISTS (SELECT 1 FROM \"SportConcepts\" WHERE \"Name\" = '{concept_safe}' AND \"ConceptCategoryId\" = v_cat_id);\n")
-        f.write(f"    END IF;\n")
-
-    f.write("END $$;\n")
+        kept_keys[normalized] = row.key
+        yield row
+
+
+def key_digest(key):
+    """Fixed-size stand-in for a key of strings, for membership tests over millions of rows."""
+    return hashlib.blake2b("\x1f".join(key).encode("utf-8"), digest_size=16).digest()
+
+
+def attach_sport(rows, sport):
+    """Stage: assign every row to the sport with the given "Sports"."Name"."""
+    for row in rows:
+        row.sport = sport
+        yield row
+
+
+def add_column(rows, column, value):
+    """Stage: write a constant value into an extra "SportConcepts" column."""
+    for row in rows:
+        row.extra += ((column, value),)
+        yield row
+
+
+# Columns every mode already writes, which --column must not repeat.
+STANDARD_COLUMNS = ("Id", "Name", "Description", "Url", "ConceptCategoryId", "IsActive", "SportId")
+
+
+def parse_column(text):
+    """Parse --column NAME=VALUE: true/false become booleans, integers ints, anything else stays text."""
+    column, separator, value = text.partition("=")
+    if not separator or not column.isidentifier():
+        raise argparse.ArgumentTypeError(f"expected NAME=VALUE with a column name, got {text!r}")
+    if column in STANDARD_COLUMNS:
+        raise argparse.ArgumentTypeError(f"{column} is always written by the seed")
+    if value.lower() in ("true", "false"):
+        return column, value.lower() == "true"
+    if value.lstrip("-").isdigit():
+        return column, int(value)
+    return column, value
+
+
+def _stage(stats, name, items, observe=None):
+    """Record a stage's time and item count when stats (seed_stats.PipelineStats) are collected."""
+    return items if stats is None else stats.stage(name, items, observe)
+
+
+def parse_rows(paths, variants=None, index=None, stats=None):
+    """Yield cleaned, deduplicated SeedRows from the given catalog files.
+
+    An index (concept_index.ConceptIndexBuilder) sees every row before
+    dedup, so duplicate rows still get their own legacy row number.
+    """
+    rows = _stage(stats, "read", read_records(paths))
+    rows = _stage(stats, "clean", clean_records(rows), stats and stats.count_nulled)
+    if index is not None:
+        rows = _stage(stats, "index", index.stage(rows))
+    return _stage(stats, "dedupe", dedupe(rows, variants))
+
+
+def _peek(rows):
+    """Return the first row and an iterator that still yields it."""
+    rows = iter(rows)
+    first = next(rows, None)
+    if first is None:
+        return None, rows
+    return first, itertools.chain((first,), rows)
+
+
+def _layout(row):
+    return row.sport is not None, tuple(column for column, _value in row.extra)
+
+
+def _checked(rows, layout):
+    """Make sure every row carries the same columns as the first one."""
+    for row in rows:
+        if _layout(row) != layout:
+            raise ValueError(f"{row!r} does not have the same columns as the first row")
+        yield row
+
+
+def _insert_columns(layout):
+    has_sport, extra = layout
+    columns = ["Name", "Description", "Url", "ConceptCategoryId", "IsActive"]
+    if has_sport:
+        columns.append("SportId")
+    columns.extend(extra)
+    return ", ".join(f'"{column}"' for column in columns)
+
+
+# Dollar-quote tag of the DO block body. Quoting a literal does not protect
+# it inside a dollar-quoted body, so catalog text containing the tag would
+# end the body early and run as SQL; such rows are refused.
+DO_TAG = "$seed$"
+
+
+def _check_do_tag(row):
+    values = (row.category, row.subcategory, row.name, row.description, row.url, row.sport,
+              *(value for _column, value in row.extra))
+    if any(isinstance(value, str) and DO_TAG in value for value in values):
+        raise ValueError(f"{row!r} contains {DO_TAG}, which would end the DO block")
+
+
+def iter_do_block(rows):
+    """Legacy mode: one guarded INSERT per concept.
+
+    The sport and the category are looked up again only when they change
+    between consecutive rows; the category by name under its parent, the
+    way --mode set resolves it. A missing sport or category raises instead
+    of dropping its concepts: this mode does not create categories, so
+    seed_categories.sql must have run first. The body is quoted with DO_TAG
+    rather than $$, which catalog text may well contain.
+    """
+    first, rows = _peek(rows)
+    layout = _layout(first) if first is not None else (False, ())
+    has_sport = layout[0]
+    columns = _insert_columns(layout)
+
+    yield f"DO {DO_TAG}\n"
+    yield "DECLARE\n"
+    yield "    v_cat_id INT;\n"
+    if has_sport:
+        yield "    v_sport_id INT;\n"
+    yield "BEGIN\n"
+
+    current_sport = None
+    current_category = None
+    for row in _checked(rows, layout):
+        _check_do_tag(row)
+        if has_sport and row.sport != current_sport:
+            current_sport = row.sport
+            yield f"    SELECT \"Id\" INTO v_sport_id FROM \"Sports\" WHERE \"Name\" = {sql_literal(current_sport)} LIMIT 1;\n"
+            yield f"    IF v_sport_id IS NULL THEN RAISE EXCEPTION 'Unknown sport: %', {sql_literal(current_sport)}; END IF;\n"
+        if (row.category or None, row.subcategory) != current_category:
+            current_category = (row.category or None, row.subcategory)
+            yield from _do_category_lookup(*current_category)
+
+        concept_safe = sql_literal(row.name)
+        values = f"{concept_safe}, {sql_literal(row.description)}, {sql_literal(row.url)}, v_cat_id, true"
+        existing = f"\"Name\" = {concept_safe} AND \"ConceptCategoryId\" = v_cat_id"
+        if has_sport:
+            values += ", v_sport_id"
+            existing += " AND \"SportId\" = v_sport_id"
+        for _column, value in row.extra:
+            values += f", {sql_value(value)}"
+
+        yield (
+            f"    -- {' '.join(row.name.split())}\n"
+            f"    INSERT INTO \"SportConcepts\" ({columns})\n"
+            f"    SELECT {values}\n"
+            f"    WHERE NOT EXISTS (SELECT 1 FROM \"SportConcepts\" WHERE {existing});\n"
+        )
+
+    yield f"END {DO_TAG};\n"
+
+
+def _do_category_lookup(parent, subcategory):
+    """Set v_cat_id to the subcategory under the top-level parent (lowest Ids, as in CATEGORY_TREE_CTES)."""
+    if parent is None:
+        under = '"ParentId" IS NULL'
+    else:
+        under = ('"ParentId" = (SELECT MIN("Id") FROM "ConceptCategories" '
+                 f'WHERE "Name" = {sql_literal(parent)} AND "ParentId" IS NULL)')
+    yield (f"    SELECT MIN(\"Id\") INTO v_cat_id FROM \"ConceptCategories\" "
+           f"WHERE \"Name\" = {sql_literal(subcategory)} AND {under};\n")
+    yield (f"    IF v_cat_id IS NULL THEN RAISE EXCEPTION 'Unknown category: % / %', "
+           f"{sql_literal(parent or '')}, {sql_literal(subcategory)}; END IF;\n")
+
+
+def _value_aliases(layout):
+    has_sport, extra = layout
+    aliases = ["parent", "category", "name", "description", "url"]
+    if has_sport:
+        aliases.append("sport")
+    aliases.extend(f"extra_{index}" for index in range(len(extra)))
+    return aliases
+
+
+def _iter_values(rows, layout):
+    """Yield the tuples of a VALUES list, one per row, matching _value_aliases."""
+    has_sport = layout[0]
+    separator = "    "
+    for row in _checked(rows, layout):
+        values = [sql_literal(row.category or None), sql_literal(row.subcategory), sql_literal(row.name),
+                  sql_literal(row.description), sql_literal(row.url)]
+        if has_sport:
+            values.append(sql_literal(row.sport))
+        values.extend(sql_value(value) for _column, value in row.extra)
+        yield f"{separator}({', '.join(values)})"
+        separator = ",\n    "
+
+
+SPORT_IDS = "SELECT \"Name\", MIN(\"Id\") AS \"Id\" FROM \"Sports\" GROUP BY \"Name\""
+
+# Builds the ConceptCategories tree (top-level category -> subcategory) from
+# the rows in "v" within the same statement. Missing categories are inserted
+# and their ids taken from RETURNING, because the rest of the statement
+# still sees the table as it was before it started.
+CATEGORY_TREE_CTES = """\
+parents AS (
+    SELECT DISTINCT v.parent AS name FROM v WHERE v.parent IS NOT NULL
+),
+inserted_parents AS (
+    INSERT INTO "ConceptCategories" ("Name", "IsActive")
+    SELECT p.name, true FROM parents p
+    WHERE NOT EXISTS (SELECT 1 FROM "ConceptCategories" c WHERE c."Name" = p.name AND c."ParentId" IS NULL)
+    RETURNING "Id", "Name"
+),
+parent_ids AS (
+    SELECT c."Name" AS name, MIN(c."Id") AS id
+    FROM "ConceptCategories" c JOIN parents p ON p.name = c."Name"
+    WHERE c."ParentId" IS NULL
+    GROUP BY c."Name"
+    UNION ALL
+    SELECT "Name", "Id" FROM inserted_parents
+),
+children AS (
+    SELECT DISTINCT v.category AS name, p.id AS parent_id
+    FROM v LEFT JOIN parent_ids p ON p.name = v.parent
+),
+inserted_children AS (
+    INSERT INTO "ConceptCategories" ("Name", "ParentId", "IsActive")
+    SELECT ch.name, ch.parent_id, true FROM children ch
+    WHERE NOT EXISTS (
+        SELECT 1 FROM "ConceptCategories" c
+        WHERE c."Name" = ch.name AND c."ParentId" IS NOT DISTINCT FROM ch.parent_id
+    )
+    -- A parentless subcategory may be a parent inserted just above.
+    AND NOT (ch.parent_id IS NULL AND EXISTS (SELECT 1 FROM inserted_parents ip WHERE ip."Name" = ch.name))
+    RETURNING "Id", "Name", "ParentId"
+),
+category_ids AS (
+    SELECT c."Name" AS name, c."ParentId" AS parent_id, MIN(c."Id") AS id
+    FROM "ConceptCategories" c
+    JOIN children ch ON ch.name = c."Name" AND c."ParentId" IS NOT DISTINCT FROM ch.parent_id
+    GROUP BY c."Name", c."ParentId"
+    UNION ALL
+    SELECT "Name", "ParentId", "Id" FROM inserted_children
+    UNION ALL
+    SELECT ip."Name", NULL, ip."Id"
+    FROM inserted_parents ip JOIN children ch ON ch.name = ip."Name" AND ch.parent_id IS NULL
+),
+"""
+
+
+def _checkpoint_guard(batch_id):
+    return f"NOT EXISTS (SELECT 1 FROM {CHECKPOINT_TABLE} WHERE \"BatchId\" = {sql_literal(batch_id)})"
+
+
+def _iter_resolved(rows, layout, batch_id=None):
+    """Open a WITH clause ending in "resolved": the rows with their category and sport ids.
+
+    Categories come from the in-statement category tree; sports are
+    resolved with the lowest Id per name, which is what the legacy LIMIT 1
+    lookup returns on a freshly seeded database. An unknown sport fails the
+    statement instead of dropping its rows. With a batch_id, the rows
+    are empty once that batch has been checkpointed, which makes the whole
+    statement a no-op on reruns.
+    """
+    has_sport = layout[0]
+    yield f"WITH v({', '.join(_value_aliases(layout))}) AS (\n"
+    if batch_id is None:
+        yield "VALUES\n"
+        yield from _iter_values(rows, layout)
+        yield "\n),\n"
+    else:
+        yield "SELECT * FROM (VALUES\n"
+        yield from _iter_values(rows, layout)
+        yield f"\n) AS t\nWHERE {_checkpoint_guard(batch_id)}\n),\n"
+    yield CATEGORY_TREE_CTES
+    yield "resolved AS (\n"
+    # The cast of a non-constant string is only evaluated, and fails, for rows
+    # whose sport is missing; SQL has no RAISE outside of PL/pgSQL.
+    sport_id = ", COALESCE(sp.\"Id\", CAST('Unknown sport: ' || v.sport AS integer)) AS sport_id"
+    yield "    SELECT v.*, c.id AS category_id" + (sport_id if has_sport else "") + "\n"
+    yield "    FROM v\n"
+    yield "    LEFT JOIN parent_ids p ON p.name = v.parent\n"
+    yield "    JOIN category_ids c ON c.name = v.category AND c.parent_id IS NOT DISTINCT FROM p.id\n"
+    if has_sport:
+        yield f"    LEFT JOIN ({SPORT_IDS}) sp ON sp.\"Name\" = v.sport\n"
+    yield ")"
+
+
+def _existing(layout):
+    """Condition matching an existing "SportConcepts" row s to a resolved row r.
+
+    Categories are shared between sports, so with a sport attached the same
+    concept name in the same category is a different row per sport.
+    """
+    condition = "s.\"Name\" = r.name AND s.\"ConceptCategoryId\" = r.category_id"
+    if layout[0]:
+        condition += " AND s.\"SportId\" = r.sport_id"
+    return condition
+
+
+def _resolved_select(layout):
+    has_sport, extra = layout
+    select = ["r.name", "r.description", "r.url", "r.category_id", "true"]
+    if has_sport:
+        select.append("r.sport_id")
+    select.extend(f"r.extra_{index}" for index in range(len(extra)))
+    return ", ".join(select)
+
+
+def iter_set_based(rows, batch_id=None):
+    """Set mode: one statement that materializes the category tree and inserts every concept.
+
+    All rows go into a single VALUES relation; missing parent categories and
+    subcategories are created in the same statement, so no concept is lost
+    to a category that was never seeded. "SportConcepts" has no unique index
+    on ("Name", "ConceptCategoryId"), so ON CONFLICT is not available and
+    the existence check is a NOT EXISTS anti-join.
+    """
+    first, rows = _peek(rows)
+    if first is None:
+        yield "-- No concepts.\n"
+        return
+
+    layout = _layout(first)
+    yield from _iter_resolved(rows, layout, batch_id)
+    yield "\n"
+    yield f"INSERT INTO \"SportConcepts\" ({_insert_columns(layout)})\n"
+    yield f"SELECT {_resolved_select(layout)}\n"
+    yield "FROM resolved r\n"
+    yield "WHERE NOT EXISTS (\n"
+    yield "    SELECT 1 FROM \"SportConcepts\" s\n"
+    yield f"    WHERE {_existing(layout)}\n"
+    yield ");\n"
+
+
+def row_hash(row):
+    """Content hash of everything the seed writes for a row."""
+    fields = [row.category, row.subcategory, row.name, row.description, row.url, row.sport]
+    fields.extend(f"{column}={value!r}" for column, value in row.extra)
+    payload = "\x1f".join("\x00" if value is None else value for value in fields)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class SeedManifest:
+    """Content hashes of the rows a seed script was generated from, keyed on SeedRow.manifest_key.
+
+    The parent category is part of the key, so a concept moved to another
+    parent is a retirement of the old row plus an insert, not an update.
+
+    A manifest describes what the database holds, so a delta run only writes
+    the next one as <manifest>.pending, tagged with the script's hash;
+    apply_seed.py --manifest moves it in place once the script has been
+    applied (see commit_manifest).
+    """
+
+    VERSION = 2
+    PENDING_SUFFIX = ".pending"
+
+    def __init__(self, rows=None):
+        self.rows = rows if rows is not None else {}
+
+    @classmethod
+    def load(cls, path):
+        """Read a manifest; a missing file is an empty manifest, so the first delta is the full catalog."""
+        if not path or not os.path.exists(path):
+            return cls()
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") == 1:
+            raise ValueError(f"{path}: version 1 manifests have no parent categories; delete it and generate "
+                             f"again, which upserts the full catalog and writes a new manifest")
+        if data.get("version") != cls.VERSION:
+            raise ValueError(f"{path}: unsupported manifest version {data.get('version')!r}")
+        return cls({(parent, subcategory, name): digest for parent, subcategory, name, digest in data["rows"]})
+
+    def save(self, path, script_sha256=None):
+        """Write the manifest atomically, sorted so that it diffs cleanly.
+
+        script_sha256 tags a pending manifest with the script that has to be
+        applied before it describes the database.
+        """
+        entries = [[*key, digest] for key, digest in sorted(self.rows.items())]
+        temp_path = path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write(f"{{\"version\": {self.VERSION}, ")
+            if script_sha256:
+                f.write(f"\"script_sha256\": \"{script_sha256}\", ")
+            f.write("\"rows\": [\n")
+            f.write(",\n".join(json.dumps(entry, ensure_ascii=False) for entry in entries))
+            f.write("\n]}\n")
+        os.replace(temp_path, path)
+
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def commit_manifest(path, script_path):
+    """Replace path with its pending manifest once script_path has been applied.
+
+    Returns False when there is no pending manifest. One generated with a
+    different script is refused, so applying an older script cannot record
+    a newer catalog.
+    """
+    pending = path + SeedManifest.PENDING_SUFFIX
+    if not os.path.exists(pending):
+        return False
+    with open(pending, encoding="utf-8") as f:
+        expected = json.load(f).get("script_sha256")
+    if expected != file_sha256(script_path):
+        raise ValueError(f"{pending} was generated with another script than {script_path}")
+    os.replace(pending, path)
+    return True
+
+
+class ManifestDiff:
+    """Stage that compares rows with a previous manifest and passes on only what changed.
+
+    Unchanged rows are dropped. Once the rows have been consumed, current
+    holds the manifest for this run and retired() the keys that disappeared.
+    A manifest covers one sport; retirements are limited to it.
+    """
+
+    def __init__(self, previous, sport=None):
+        self.previous = previous
+        self.sport = sport
+        self.current = SeedManifest()
+        self.inserted = 0
+        self.updated = 0
+        self.unchanged = 0
+
+    def changed(self, rows):
+        previous = self.previous.rows
+        current = self.current.rows
+        for row in rows:
+            key = row.manifest_key
+            digest = row_hash(row)
+            current[key] = digest
+            old = previous.get(key)
+            if old == digest:
+                self.unchanged += 1
+                continue
+            if old is None:
+                self.inserted += 1
+            else:
+                self.updated += 1
+            yield row
+
+    def retired(self):
+        current = self.current.rows
+        return sorted(key for key in self.previous.rows if key not in current)
+
+
+def iter_upserts(rows, batch_id=None):
+    """Insert new rows and overwrite the text of existing ones in a single statement.
+
+    Unlike the other modes, edited descriptions and URLs reach the database:
+    rows that already exist for (Name, ConceptCategoryId, SportId) are updated and
+    reactivated, the rest are inserted. Categories are materialized as in
+    set mode.
+    """
+    first, rows = _peek(rows)
+    if first is None:
+        yield "-- No inserted or updated concepts.\n"
+        return
+
+    layout = _layout(first)
+    has_sport, extra = layout
+    sets = ["\"Description\" = r.description", "\"Url\" = r.url", "\"IsActive\" = true"]
+    sets.extend(f"\"{column}\" = r.extra_{index}" for index, column in enumerate(extra))
+
+    yield from _iter_resolved(rows, layout, batch_id)
+    yield ",\nupdated AS (\n"
+    yield "    UPDATE \"SportConcepts\" s\n"
+    yield f"    SET {', '.join(sets)}\n"
+    yield "    FROM resolved r\n"
+    yield f"    WHERE {_existing(layout)}\n"
+    yield ")\n"
+    yield f"INSERT INTO \"SportConcepts\" ({_insert_columns(layout)})\n"
+    yield f"SELECT {_resolved_select(layout)}\n"
+    yield "FROM resolved r\n"
+    yield "WHERE NOT EXISTS (\n"
+    yield "    SELECT 1 FROM \"SportConcepts\" s\n"
+    yield f"    WHERE {_existing(layout)}\n"
+    yield ");\n"
+
+
+def iter_retirements(keys, batch_id=None, sport=None):
+    """Deactivate concepts that are no longer in the catalog. Rows are kept for existing references.
+
+    With a sport, only that sport's concepts are retired.
+    """
+    if not keys:
+        yield "-- No retired concepts.\n"
+        return
+
+    yield "UPDATE \"SportConcepts\" s\n"
+    yield "SET \"IsActive\" = false\n"
+    yield "FROM (VALUES\n"
+    yield ",\n".join(f"    ({sql_literal(parent or None)}, {sql_literal(subcategory)}, {sql_literal(name)})"
+                      for parent, subcategory, name in keys)
+    yield "\n) AS r(parent, category, name)\n"
+    # Categories are resolved by (name, parent) as in the category tree, so a
+    # subcategory name used under two parents retires from the right one.
+    yield "JOIN \"ConceptCategories\" c ON c.\"Name\" = r.category\n"
+    yield "LEFT JOIN \"ConceptCategories\" p ON p.\"Id\" = c.\"ParentId\"\n"
+    yield "WHERE s.\"Name\" = r.name AND s.\"ConceptCategoryId\" = c.\"Id\"\n"
+    yield "    AND p.\"Name\" IS NOT DISTINCT FROM r.parent"
+    if sport is not None:
+        yield f"\n    AND s.\"SportId\" = (SELECT MIN(\"Id\") FROM \"Sports\" WHERE \"Name\" = {sql_literal(sport)})"
+    if batch_id is not None:
+        yield f"\n    AND {_checkpoint_guard(batch_id)}"
+    yield ";\n"
+
+
+def iter_delta(rows, diff):
+    """Delta script: upserts for inserted/updated rows, then retirements."""
+    yield "-- Inserted and updated concepts\n"
+    yield from iter_upserts(diff.changed(rows))
+    # The retired keys are only known once every row has been compared.
+    yield "\n-- Retired concepts\n"
+    yield from iter_retirements(diff.retired(), sport=diff.sport)
+
+
+CHECKPOINT_TABLE = '"__SeedCheckpoints"'
+
+CHECKPOINT_DDL = (
+    f"CREATE TABLE IF NOT EXISTS {CHECKPOINT_TABLE} (\n"
+    "    \"BatchId\" text PRIMARY KEY,\n"
+    "    \"AppliedAt\" timestamptz NOT NULL DEFAULT now()\n"
+    ");\n"
+)
+
+# Every batch starts with this marker line; apply_seed.py splits on it.
+BATCH_MARKER = "-- @batch "
+
+DEFAULT_BATCH_ROWS = 500
+DEFAULT_BATCH_BYTES = 1024 * 1024
+
+
+def _row_size(row):
+    """UTF-8 bytes of a row's text fields, which is what the batch size limit counts."""
+    return sum(len(field.encode("utf-8")) for field in (row.name, row.subcategory, row.description, row.url) if field)
+
+
+def _batch_id(shard, number, rows):
+    """Stable id for a batch: shard, position and content, so edited batches are reapplied."""
+    shard_tag = hashlib.blake2b(shard.encode("utf-8"), digest_size=3).hexdigest()
+    content = hashlib.blake2b(digest_size=5)
+    for row in rows:
+        content.update(row_hash(row).encode("ascii"))
+    return f"{shard_tag}-{number:05d}-{content.hexdigest()}"
+
+
+def _iter_batch(batch_id, shard, statement):
+    yield f"\n{BATCH_MARKER}{batch_id} shard={shard}\n"
+    yield "BEGIN;\n"
+    yield from statement
+    yield f"INSERT INTO {CHECKPOINT_TABLE} (\"BatchId\") VALUES ({sql_literal(batch_id)}) ON CONFLICT DO NOTHING;\n"
+    yield "COMMIT;\n"
+
+
+def iter_batches(rows, statement, batch_rows=DEFAULT_BATCH_ROWS, batch_bytes=DEFAULT_BATCH_BYTES):
+    """Split rows into size-bounded batches, each its own checkpointed transaction.
+
+    Rows are grouped into shards by top-level category. Shards touch
+    disjoint parts of the category tree, so their batches can be applied
+    over separate connections at the same time; batches within a shard must
+    run in order. Only one open batch per shard is held in memory.
+    """
+    yield "-- Chunked seed: apply with apply_seed.py to resume and parallelize, or run as a plain script.\n"
+    yield CHECKPOINT_DDL
+
+    pending = {}
+    numbers = {}
+
+    def flush(shard):
+        batch, _size = pending.pop(shard)
+        number = numbers[shard] = numbers.get(shard, 0) + 1
+        batch_id = _batch_id(shard, number, batch)
+        return _iter_batch(batch_id, shard, statement(batch, batch_id))
+
+    for row in rows:
+        shard = row.category or row.subcategory
+        batch = pending.setdefault(shard, [[], 0])
+        batch[0].append(row)
+        batch[1] += _row_size(row)
+        if len(batch[0]) >= batch_rows or batch[1] >= batch_bytes:
+            yield from flush(shard)
+
+    for shard in list(pending):
+        yield from flush(shard)
+
+
+RETIRED_SHARD = "(retired)"
+
+
+def iter_batched_delta(rows, diff, batch_rows=DEFAULT_BATCH_ROWS, batch_bytes=DEFAULT_BATCH_BYTES):
+    """Delta script in checkpointed batches; retirements form their own shard at the end."""
+    yield from iter_batches(diff.changed(rows), iter_upserts, batch_rows, batch_bytes)
+
+    retired = diff.retired()
+    for number, start in enumerate(range(0, len(retired), batch_rows), 1):
+        keys = retired[start:start + batch_rows]
+        digest = hashlib.blake2b("\x1f".join("\x1f".join(key) for key in keys).encode("utf-8"),
+                                 digest_size=5).hexdigest()
+        batch_id = f"retired-{number:05d}-{digest}"
+        yield from _iter_batch(batch_id, RETIRED_SHARD, iter_retirements(keys, batch_id, diff.sport))
+
+
+def write_chunked(f, fragments, chunk_size=WRITE_CHUNK_SIZE):
+    """Write fragments in batches so each write call carries roughly chunk_size characters."""
+    buffer = []
+    buffered = 0
+    for fragment in fragments:
+        buffer.append(fragment)
+        buffered += len(fragment)
+        if buffered >= chunk_size:
+            f.write("".join(buffer))
+            buffer.clear()
+            buffered = 0
+    if buffer:
+        f.write("".join(buffer))
+
+
+EMITTERS = {
+    "do": iter_do_block,
+    "set": iter_set_based,
+}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate the SportConcepts seed script.")
+    parser.add_argument("inputs", nargs="*", default=[DEFAULT_INPUT],
+                        help="headerless TSV or headed CSV catalogs, read in order (default: %(default)s)")
+    parser.add_argument("--mode", choices=sorted(EMITTERS), default="do",
+                        help="'do' emits the legacy per-row DO block (categories must already exist), "
+                             "'set' a single statement that also creates the category tree")
+    parser.add_argument("--sport", help="attach every concept to the \"Sports\" row with this name")
+    parser.add_argument("--column", type=parse_column, action="append", default=[], metavar="NAME=VALUE",
+                        help="also write this value into the \"SportConcepts\" column NAME for every concept, "
+                             "e.g. IsSystem=true or TacticalComplexity=2; repeatable")
+    parser.add_argument("--manifest",
+                        help="emit only the delta against this content-hash manifest (upserts and retirements) "
+                             "instead of the full catalog; a missing file means everything is new")
+    parser.add_argument("--manifest-out",
+                        help="manifest this run advances (default: --manifest); the new one is written as "
+                             "<path>.pending and apply_seed.py --manifest moves it in place once the script is applied")
+    parser.add_argument("--duplicates-report",
+                        help="write a JSON report of spelling variants and near-duplicate concepts")
+    parser.add_argument("--fail-on-duplicates", action="store_true",
+                        help="exit with status 1, leaving the output, index and manifest untouched, "
+                             "when the report is not empty")
+    parser.add_argument("--accepted-duplicates", default=DEFAULT_ACCEPTED_DUPLICATES,
+                        help="pairs reviewed and kept on purpose, in the report's format (default: %(default)s)")
+    parser.add_argument("--batch-rows", type=int,
+                        help=f"split set/delta output into checkpointed transactions of at most this many rows "
+                             f"(e.g. {DEFAULT_BATCH_ROWS}), grouped by top-level category")
+    parser.add_argument("--batch-bytes", type=int, default=DEFAULT_BATCH_BYTES,
+                        help="also close a batch once its text fields reach this many UTF-8 bytes "
+                             "(default: %(default)s)")
+    parser.add_argument("--index",
+                        help="also write the concept lookup index here: stable tag ids and names, plus "
+                             "ExerciseImporter row tags when the input is its single CSV export")
+    parser.add_argument("--stats", metavar="PATH",
+                        help="write per-stage wall/CPU times and row counters as JSON (also summarized on stderr)")
+    parser.add_argument("--profile", metavar="PATH", help="run under cProfile and dump the pstats file here")
+    parser.add_argument("--trace-memory", action="store_true",
+                        help="trace allocations with tracemalloc and add the peak and top sites to the stats")
+    parser.add_argument("--explain", action="store_true",
+                        help="run the generated script under EXPLAIN (ANALYZE, BUFFERS) against --dsn, "
+                             "in a transaction that is rolled back, and add the plans to the stats")
+    parser.add_argument("--dsn", default=os.environ.get("SEED_DATABASE_URL"),
+                        help="PostgreSQL connection string for --explain (default: $SEED_DATABASE_URL)")
+    parser.add_argument("-o", "--output", default="seed_concepts.sql")
+    args = parser.parse_args(argv)
+    if args.batch_rows and args.mode == "do" and not args.manifest:
+        parser.error("--batch-rows needs --mode set or --manifest")
+    if args.explain and not args.dsn:
+        parser.error("--explain needs --dsn or SEED_DATABASE_URL")
+
+    if not (args.stats or args.profile or args.trace_memory or args.explain):
+        return generate(args)
+
+    from seed_stats import PipelineStats, explain_script, write_report
+    stats = PipelineStats(args.trace_memory, args.profile)
+    stats.start()
+    try:
+        status = generate(args, stats)
+    finally:
+        stats.stop()
+    if args.explain and status == 0:
+        stats.database = explain_script(args.dsn, args.output)
+    if args.stats:
+        write_report(stats.report(), args.stats)
+    stats.print_summary()
+    return status
+
+
+def generate(args, stats=None):
+    """Write the seed script described by the parsed command line; return the exit status.
+
+    The script is written to a temporary file that only replaces the output
+    once the duplicate check has passed, so a failed run leaves the previous
+    script, index and manifest in place.
+    """
+    check_duplicates = args.duplicates_report or args.fail_on_duplicates
+    variants = None
+    if check_duplicates:
+        variants = []
+        from seed_dedup import NearDuplicateIndex
+        near_duplicates = NearDuplicateIndex()
+    index = None
+    if args.index:
+        from concept_index import ConceptIndexBuilder, has_importer_rows
+        index = ConceptIndexBuilder(has_importer_rows(args.inputs))
+
+    temp_path = args.output + ".tmp"
+    try:
+        with open(temp_path, "w", encoding="utf-8") as f:
+            rows = parse_rows(args.inputs, variants, index, stats)
+            if check_duplicates:
+                rows = _stage(stats, "near_duplicates", near_duplicates.stage(rows))
+            if args.sport:
+                rows = _stage(stats, "sport", attach_sport(rows, args.sport))
+            for column, value in args.column:
+                rows = _stage(stats, f"column {column}", add_column(rows, column, value))
+            if args.manifest:
+                diff = ManifestDiff(SeedManifest.load(args.manifest), args.sport)
+                if args.batch_rows:
+                    fragments = iter_batched_delta(rows, diff, args.batch_rows, args.batch_bytes)
+                else:
+                    fragments = iter_delta(rows, diff)
+            elif args.batch_rows:
+                fragments = iter_batches(rows, EMITTERS[args.mode], args.batch_rows, args.batch_bytes)
+            else:
+                fragments = EMITTERS[args.mode](rows)
+            if stats is None:
+                write_chunked(f, fragments)
+            else:
+                # Escaping and formatting happen while fragments are produced.
+                fragments = _stage(stats, "emit", fragments)
+                write_chunked(stats.writer(f), fragments)
+
+        if stats is not None:
+            stats.counters.update(rows_read=stats.items("read"),
+                                  skipped=stats.items("read") - stats.items("clean"),
+                                  deduped=stats.items("clean") - stats.items("dedupe"),
+                                  emitted=diff.inserted + diff.updated if args.manifest else stats.items("dedupe"),
+                                  output_bytes=os.path.getsize(temp_path))
+
+        if check_duplicates:
+            from seed_dedup import build_report, has_duplicates, load_accepted, print_summary, write_report
+            report = build_report(variants, near_duplicates, load_accepted(args.accepted_duplicates))
+            if args.duplicates_report:
+                write_report(report, args.duplicates_report)
+            print_summary(report)
+            if args.fail_on_duplicates and has_duplicates(report):
+                return 1
+
+        os.replace(temp_path, args.output)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+    if index is not None:
+        print(f"Index: {args.index} sha256={index.write(args.index)}")
+
+    if args.manifest:
+        manifest_path = args.manifest_out or args.manifest
+        diff.current.save(manifest_path + SeedManifest.PENDING_SUFFIX, file_sha256(args.output))
+        print(f"Delta: {diff.inserted} inserted, {diff.updated} updated, "
+              f"{len(diff.retired())} retired, {diff.unchanged} unchanged")
+        print(f"Pending manifest: apply with apply_seed.py {args.output} --manifest {manifest_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,190 @@
+import argparse
+import json
+import os
+import sys
+import zlib
+from collections import defaultdict
+
+from generate_concepts_seed import DEFAULT_ACCEPTED_DUPLICATES, DEFAULT_INPUT, normalize_key, parse_rows
+
+DEFAULT_THRESHOLD = 0.8
+
+# Signature layout: NUM_BINS one-permutation MinHash bins, split into bands
+# of BAND_ROWS bins for locality-sensitive hashing. Two names share at least
+# one band bucket with probability ~1 - (1 - J**3)**4, i.e. ~94% at Jaccard
+# 0.8 and ~5% at Jaccard 0.3, so exact comparisons only happen for likely
+# pairs instead of for every pair in the catalog.
+NUM_BINS = 12
+BAND_ROWS = 3
+
+# A bucket this large means many concepts with the same signature; comparing
+# all of them would be quadratic, so only its first members are paired.
+MAX_BUCKET = 200
+
+
+def ngrams(text, n=3):
+    """Character n-grams of a normalized name, padded so short words still yield grams."""
+    padded = f" {text} "
+    return {padded[i:i + n] for i in range(max(1, len(padded) - n + 1))}
+
+
+def jaccard(a, b):
+    union = len(a | b)
+    return len(a & b) / union if union else 1.0
+
+
+def minhash_signature(grams, num_bins=NUM_BINS):
+    """One-permutation MinHash: hash every gram once, keep the minimum per bin.
+
+    Empty bins borrow the next non-empty bin (rotation densification), with
+    an offset so that borrowed values never collide with real ones.
+    """
+    bins = [None] * num_bins
+    for gram in grams:
+        value = zlib.crc32(gram.encode("utf-8"))
+        slot = value % num_bins
+        value //= num_bins
+        current = bins[slot]
+        if current is None or value < current:
+            bins[slot] = value
+
+    for slot in range(num_bins):
+        if bins[slot] is None:
+            for step in range(1, num_bins):
+                borrowed = bins[(slot + step) % num_bins]
+                if borrowed is not None:
+                    bins[slot] = borrowed + (step << 32)
+                    break
+    return bins
+
+
+class NearDuplicateIndex:
+    """Blocked MinHash/LSH index over normalized concept names.
+
+    Rows are blocked by normalized subcategory (concepts are unique per
+    category), or treated as one block with block_by_category=False.
+    Candidate pairs from shared band buckets are confirmed with the exact
+    n-gram Jaccard similarity before being reported.
+    """
+
+    def __init__(self, threshold=DEFAULT_THRESHOLD, block_by_category=True):
+        self.threshold = threshold
+        self.block_by_category = block_by_category
+        self.keys = []
+        self.names = []
+        self.buckets = defaultdict(list)
+
+    def add(self, row):
+        index = len(self.keys)
+        name = normalize_key(row.name)
+        block = normalize_key(row.subcategory) if self.block_by_category else ""
+        self.keys.append(row.key)
+        self.names.append(name)
+
+        signature = minhash_signature(ngrams(name))
+        for band in range(0, NUM_BINS, BAND_ROWS):
+            self.buckets[(block, band, *signature[band:band + BAND_ROWS])].append(index)
+
+    def stage(self, rows):
+        """Pipeline stage: index every row on its way through."""
+        for row in rows:
+            self.add(row)
+            yield row
+
+    def pairs(self):
+        """Return (score, key_a, key_b) for likely duplicates, most similar first."""
+        candidates = set()
+        for members in self.buckets.values():
+            members = members[:MAX_BUCKET]
+            for position, first in enumerate(members):
+                for second in members[position + 1:]:
+                    candidates.add((first, second))
+
+        grams = {}
+
+        def grams_of(index):
+            cached = grams.get(index)
+            if cached is None:
+                cached = grams[index] = ngrams(self.names[index])
+            return cached
+
+        found = []
+        for first, second in candidates:
+            score = jaccard(grams_of(first), grams_of(second))
+            if score >= self.threshold:
+                found.append((round(score, 3), self.keys[first], self.keys[second]))
+        found.sort(key=lambda pair: (-pair[0], pair[1], pair[2]))
+        return found
+
+
+def load_accepted(path):
+    """Accepted pairs as unordered key pairs; a missing file accepts nothing.
+
+    The file has the report's format, so a reviewed report, or the part of
+    it that is fine, can be saved as is.
+    """
+    if not path or not os.path.exists(path):
+        return set()
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    accepted = {frozenset((tuple(pair["kept"]), tuple(pair["dropped"]))) for pair in data.get("variants", [])}
+    accepted.update(frozenset((tuple(pair["a"]), tuple(pair["b"]))) for pair in data.get("near_duplicates", []))
+    return accepted
+
+
+def build_report(variants, index, accepted=frozenset()):
+    """Machine-readable duplicate report: normalized-key collisions and near duplicates, minus accepted pairs."""
+    return {
+        "threshold": index.threshold,
+        "variants": [{"kept": list(kept), "dropped": list(dropped)} for kept, dropped in variants
+                     if frozenset((kept, dropped)) not in accepted],
+        "near_duplicates": [{"score": score, "a": list(a), "b": list(b)} for score, a, b in index.pairs()
+                            if frozenset((a, b)) not in accepted],
+    }
+
+
+def write_report(report, path):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+        f.write("\n")
+
+
+def print_summary(report, file=sys.stderr):
+    for variant in report["variants"]:
+        (_, kept), (subcategory, dropped) = variant["kept"], variant["dropped"]
+        print(f"Variant: '{dropped}' in '{subcategory}' dropped as a duplicate of '{kept}'", file=file)
+    for pair in report["near_duplicates"]:
+        (subcategory_a, a), (subcategory_b, b) = pair["a"], pair["b"]
+        print(f"Near duplicate ({pair['score']:.2f}): '{a}' in '{subcategory_a}' / '{b}' in '{subcategory_b}'", file=file)
+
+
+def has_duplicates(report):
+    return bool(report["variants"] or report["near_duplicates"])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Report spelling variants and near-duplicate concepts in catalogs.")
+    parser.add_argument("inputs", nargs="*", default=[DEFAULT_INPUT])
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="minimum n-gram Jaccard similarity to report (default: %(default)s)")
+    parser.add_argument("--across-categories", action="store_true",
+                        help="also compare concepts in different subcategories")
+    parser.add_argument("--accepted", default=DEFAULT_ACCEPTED_DUPLICATES,
+                        help="pairs to leave out of the report, in the report's format (default: %(default)s)")
+    parser.add_argument("--report", help="write the JSON report here")
+    args = parser.parse_args(argv)
+
+    variants = []
+    index = NearDuplicateIndex(args.threshold, block_by_category=not args.across_categories)
+    for _row in index.stage(parse_rows(args.inputs, variants)):
+        pass
+
+    report = build_report(variants, index, load_accepted(args.accepted))
+    if args.report:
+        write_report(report, args.report)
+    print_summary(report)
+    return 1 if has_duplicates(report) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,349 @@
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+TOP_ALLOCATIONS = 10
+# Allocation sites are captured again each time traced memory has grown by this
+# factor; each capture walks every traced block, so captures are kept few.
+SNAPSHOT_GROWTH = 1.5
+
+# Statements EXPLAIN accepts; everything else (DO blocks, DDL) is run and timed as is.
+EXPLAINABLE = ("INSERT", "UPDATE", "DELETE", "WITH", "SELECT")
+# The capture runs in its own transaction, so the script's own ones are skipped.
+TRANSACTION_CONTROL = ("BEGIN", "COMMIT", "ROLLBACK", "START")
+
+
+class StageStats:
+    __slots__ = ("name", "upstream", "items", "wall", "cpu")
+
+    def __init__(self, name, upstream=None):
+        self.name = name
+        # The stage this one pulls its items from, whose time is inside ours.
+        self.upstream = upstream
+        self.items = 0
+        self.wall = 0.0
+        self.cpu = 0.0
+
+    def own(self):
+        """(wall, cpu) spent in this stage itself, without the stage it pulls from."""
+        if self.upstream is None:
+            return self.wall, self.cpu
+        return self.wall - self.upstream.wall, self.cpu - self.upstream.cpu
+
+    def as_dict(self):
+        wall, cpu = self.own()
+        return {"name": self.name, "items": self.items,
+                "wall_seconds": round(wall, 4), "cpu_seconds": round(cpu, 4)}
+
+
+class PipelineStats:
+    """Per-stage wall and CPU timers and row counters for the seed pipeline.
+
+    Stages are lazy generators, each pulling from the one registered before
+    it, so a stage's next() includes the time of everything upstream. Each
+    stage is timed that way and reported net of its upstream stage; time
+    outside every stage (reports, index and manifest writing) is "other".
+    Reading the clocks costs about a microsecond per row and stage, which
+    is why this is opt-in.
+    """
+
+    def __init__(self, trace_memory=False, profile=None):
+        self.trace_memory = trace_memory
+        self.profile_path = profile
+        self.profiler = None
+        self.stages = {}
+        self.counters = dict.fromkeys(("rows_read", "skipped", "deduped", "nulled_descriptions", "nulled_urls",
+                                       "emitted", "output_bytes"), 0)
+        self.database = None
+        self.memory = None
+        self.top_allocations = None
+        self.top_allocations_at = 0
+        self.other = StageStats("other")
+        self.last = None
+        self.started = None
+        self.wall = 0.0
+        self.cpu = 0.0
+
+    def start(self):
+        if self.trace_memory:
+            import tracemalloc
+            tracemalloc.start()
+        if self.profile_path:
+            import cProfile
+            self.profiler = cProfile.Profile()
+            self.profiler.enable()
+        self.started = (time.perf_counter(), time.process_time())
+
+    def stop(self):
+        self.wall = time.perf_counter() - self.started[0]
+        self.cpu = time.process_time() - self.started[1]
+        owned = [record.own() for record in self.stages.values()]
+        self.other.wall = self.wall - sum(wall for wall, _cpu in owned)
+        self.other.cpu = self.cpu - sum(cpu for _wall, cpu in owned)
+        if self.profiler is not None:
+            self.profiler.disable()
+            self.profiler.dump_stats(self.profile_path)
+        if self.trace_memory:
+            import tracemalloc
+            self.sample_memory()
+            current, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            self.memory = {
+                "traced_current_bytes": current,
+                "traced_peak_bytes": peak,
+                "top_allocations_at_bytes": self.top_allocations_at,
+                "top_allocations": self.top_allocations,
+            }
+
+    def sample_memory(self):
+        """Record the top allocation sites if traced memory has grown by SNAPSHOT_GROWTH since the last time.
+
+        Called while the pipeline runs: once the stages are exhausted, their
+        dedup sets, indexes and manifest maps are freed, and a snapshot taken
+        at the end would not show where the peak went. Only the top sites are
+        kept, never the snapshot itself.
+        """
+        if not self.trace_memory:
+            return
+        import tracemalloc
+        current, _peak = tracemalloc.get_traced_memory()
+        if self.top_allocations is not None and current < self.top_allocations_at * SNAPSHOT_GROWTH:
+            return
+        snapshot = tracemalloc.take_snapshot()
+        self.top_allocations = [{"where": str(stat.traceback), "bytes": stat.size, "blocks": stat.count}
+                                for stat in snapshot.statistics("lineno")[:TOP_ALLOCATIONS]]
+        self.top_allocations_at = current
+
+    def stage(self, name, items, observe=None):
+        """Wrap a pipeline stage pulling from the previous one; its time and item count go under name."""
+        record = self.stages[name] = StageStats(name, self.last)
+        self.last = record
+        return self._timed(record, iter(items), observe)
+
+    @staticmethod
+    def _timed(record, iterator, observe):
+        wall = time.perf_counter
+        cpu = time.process_time
+        items = 0
+        wall_total = cpu_total = 0.0
+        try:
+            while True:
+                wall_start = wall()
+                cpu_start = cpu()
+                try:
+                    item = next(iterator)
+                finally:
+                    cpu_total += cpu() - cpu_start
+                    wall_total += wall() - wall_start
+                items += 1
+                if observe is not None:
+                    observe(item)
+                yield item
+        except StopIteration:
+            return
+        finally:
+            record.items += items
+            record.wall += wall_total
+            record.cpu += cpu_total
+
+    def writer(self, f):
+        """File-like wrapper that records the time spent in write() as the "write" stage."""
+        return _TimedWriter(self, f)
+
+    def count_nulled(self, row):
+        """Observer for cleaned rows: count placeholder descriptions and URLs turned into NULL."""
+        if row.description is None:
+            self.counters["nulled_descriptions"] += 1
+        if row.url is None:
+            self.counters["nulled_urls"] += 1
+
+    def items(self, name):
+        record = self.stages.get(name)
+        return record.items if record is not None else 0
+
+    def report(self):
+        report = {
+            "python": platform.python_version(),
+            "total": {"wall_seconds": round(self.wall, 4), "cpu_seconds": round(self.cpu, 4)},
+            "stages": [record.as_dict() for record in (*self.stages.values(), self.other)],
+            "counters": dict(self.counters),
+        }
+        if resource is not None:
+            peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            # ru_maxrss is in KiB on Linux and bytes on macOS.
+            report["peak_rss_kb"] = peak // 1024 if sys.platform == "darwin" else peak
+        if self.memory is not None:
+            report["memory"] = self.memory
+        if self.profile_path:
+            report["profile"] = self.profile_path
+        if self.database is not None:
+            report["database"] = self.database
+        return report
+
+    def print_summary(self, file=sys.stderr):
+        for record in (*self.stages.values(), self.other):
+            wall, cpu = record.own()
+            print(f"{record.name:>16} {wall:8.3f} s wall {cpu:8.3f} s cpu {record.items:>10} items", file=file)
+        print(f"{'total':>16} {self.wall:8.3f} s wall {self.cpu:8.3f} s cpu", file=file)
+        print(", ".join(f"{name} {value}" for name, value in self.counters.items()), file=file)
+        for statement in self.database or ():
+            print(f"{'sql':>16} {statement['seconds']:8.3f} s        statement {statement['index']}: "
+                  f"{statement['summary']}", file=file)
+
+
+class _TimedWriter:
+    def __init__(self, stats, f):
+        self.f = f
+        self.stats = stats
+        # Called by whoever drains the last stage, so nothing upstream runs inside write().
+        self.record = stats.stages["write"] = StageStats("write")
+
+    def write(self, text):
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            written = self.f.write(text)
+        finally:
+            self.record.cpu += time.process_time() - cpu_start
+            self.record.wall += time.perf_counter() - wall_start
+            self.record.items += 1
+        # Outside the timed section; every stage is still alive here.
+        self.stats.sample_memory()
+        return written
+
+
+def write_report(report, path):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+        f.write("\n")
+
+
+def split_statements(sql):
+    """Split a script into statements on top-level semicolons.
+
+    Quoted strings, quoted identifiers, dollar-quoted bodies (DO $$ ... $$)
+    and -- comments are skipped over, so semicolons inside them do not split.
+    """
+    statements = []
+    start = 0
+    position = 0
+    length = len(sql)
+    while position < length:
+        char = sql[position]
+        if char in ("'", '"'):
+            position += 1
+            while position < length:
+                if sql[position] == char:
+                    if sql.startswith(char, position + 1):
+                        position += 2
+                        continue
+                    break
+                position += 1
+        elif char == "-" and sql.startswith("--", position):
+            newline = sql.find("\n", position)
+            position = length if newline == -1 else newline
+        elif char == "$":
+            close = sql.find("$", position + 1)
+            tag = sql[position:close + 1] if close != -1 else ""
+            if tag and (tag == "$$" or tag[1:-1].isidentifier()):
+                end = sql.find(tag, close + 1)
+                position = length if end == -1 else end + len(tag) - 1
+        elif char == ";":
+            statements.append(sql[start:position + 1])
+            start = position + 1
+        position += 1
+    if sql[start:].strip():
+        statements.append(sql[start:])
+    return [statement for statement in statements if _first_word(statement)]
+
+
+def _first_word(statement):
+    """First keyword of a statement, ignoring comment lines; "" for comments only."""
+    for line in statement.splitlines():
+        line = line.strip()
+        if line and not line.startswith("--"):
+            return line.split(None, 1)[0].rstrip(";").upper()
+    return ""
+
+
+def _summary(statement):
+    lines = [line.strip() for line in statement.splitlines() if line.strip() and not line.strip().startswith("--")]
+    return lines[0][:80] if lines else ""
+
+
+def explain_script(dsn, path):
+    """Run a generated script under EXPLAIN (ANALYZE, BUFFERS) in one transaction, then roll it back.
+
+    ANALYZE really executes each statement, so later statements see the
+    effects of earlier ones, as they would in a normal run. Statements
+    EXPLAIN does not accept (DO blocks, CREATE TABLE) are executed and
+    timed without a plan.
+    """
+    from apply_seed import connect
+
+    with open(path, encoding="utf-8") as f:
+        statements = split_statements(f.read())
+
+    results = []
+    connection = connect(dsn)
+    try:
+        cursor = connection.cursor()
+        cursor.execute("BEGIN")
+        try:
+            for index, statement in enumerate(statements, 1):
+                keyword = _first_word(statement)
+                if keyword in TRANSACTION_CONTROL:
+                    continue
+                result = {"index": index, "summary": _summary(statement), "plan": None}
+                start = time.perf_counter()
+                if keyword in EXPLAINABLE:
+                    cursor.execute("EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) " + statement)
+                    plan = cursor.fetchone()[0]
+                    result["plan"] = json.loads(plan) if isinstance(plan, str) else plan
+                else:
+                    cursor.execute(statement)
+                result["seconds"] = round(time.perf_counter() - start, 4)
+                if result["plan"]:
+                    top = result["plan"][0]
+                    result["execution_ms"] = top.get("Execution Time")
+                    result["shared_hit_blocks"] = top["Plan"].get("Shared Hit Blocks")
+                    result["shared_read_blocks"] = top["Plan"].get("Shared Read Blocks")
+                results.append(result)
+        finally:
+            cursor.execute("ROLLBACK")
+            cursor.close()
+    finally:
+        connection.close()
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Capture EXPLAIN (ANALYZE, BUFFERS) for every statement of a generated seed script; "
+                    "the script runs in a transaction that is rolled back.")
+    parser.add_argument("seed", help="generated seed script")
+    parser.add_argument("--dsn", default=os.environ.get("SEED_DATABASE_URL"),
+                        help="PostgreSQL connection string (default: $SEED_DATABASE_URL)")
+    parser.add_argument("--json", metavar="PATH", help="write the plans and timings here")
+    args = parser.parse_args(argv)
+    if not args.dsn:
+        parser.error("no database: pass --dsn or set SEED_DATABASE_URL")
+
+    results = explain_script(args.dsn, args.seed)
+    if args.json:
+        write_report({"script": args.seed, "database": results}, args.json)
+    for result in results:
+        print(f"{result['seconds']:8.3f} s  statement {result['index']}: {result['summary']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,62 @@
+import os
+import sys
+
+import pytest
+
+TESTS = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(TESTS))
+
+from generate_concepts_seed import CHECKPOINT_TABLE, EMPTY_URL, NO_DESCRIPTION  # noqa: E402
+
+SCHEMA = os.path.join(TESTS, "seed_schema.sql")
+SEED_TABLES = ('"SportConcepts"', '"ConceptCategories"', '"Sports"', CHECKPOINT_TABLE)
+SPORTS = ("Baloncesto", "Futbol")
+
+
+class Database:
+    def __init__(self, dsn):
+        self.dsn = dsn
+
+    def query(self, sql):
+        from apply_seed import connect, execute
+
+        connection = connect(self.dsn)
+        try:
+            return execute(connection, sql)
+        finally:
+            connection.close()
+
+    def count(self, where="true"):
+        return self.query(f'SELECT count(*) FROM "SportConcepts" WHERE {where}')[0][0]
+
+
+@pytest.fixture
+def database():
+    """A migrated scratch database holding SPORTS; skipped unless SEED_TEST_DATABASE_URL is set.
+
+    Point SEED_TEST_DATABASE_URL at a throwaway database: every test drops
+    and recreates the seed tables in it.
+    """
+    dsn = os.environ.get("SEED_TEST_DATABASE_URL")
+    if not dsn:
+        pytest.skip("set SEED_TEST_DATABASE_URL to a scratch PostgreSQL database")
+    database = Database(dsn)
+    database.query(f"DROP TABLE IF EXISTS {', '.join(SEED_TABLES)} CASCADE")
+    with open(SCHEMA, encoding="utf-8") as f:
+        database.query(f.read())
+    database.query('INSERT INTO "Sports" ("Name", "IsActive", "CreatedAt", "UpdatedAt") VALUES '
+                   + ", ".join(f"('{sport}', true, now(), now())" for sport in SPORTS))
+    return database
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    """Write catalog rows, (category, subcategory, name[, description[, url]]), as a TSV; return its path."""
+    def write(rows, name="catalog.tsv"):
+        path = tmp_path / name
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            for row in rows:
+                fields = (*row, *(NO_DESCRIPTION, EMPTY_URL)[len(row) - 3:])
+                f.write("\t".join(fields) + "\n")
+        return str(path)
+    return write
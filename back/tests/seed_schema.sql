@@ -0,0 +1,48 @@
+-- The tables the concept seed touches, as the EF migrations leave them
+-- (see SportPlanner/Migrations/AppDbContextModelSnapshot.cs). Columns the
+-- seed never writes are left out.
+CREATE TABLE "Sports" (
+    "Id" integer GENERATED BY DEFAULT AS IDENTITY,
+    "Name" text NOT NULL,
+    "Slug" text,
+    "Description" text,
+    "IsActive" boolean NOT NULL,
+    "CreatedAt" timestamp with time zone NOT NULL,
+    "UpdatedAt" timestamp with time zone NOT NULL,
+    CONSTRAINT "PK_Sports" PRIMARY KEY ("Id")
+);
+CREATE UNIQUE INDEX "IX_Sports_Name" ON "Sports" ("Name");
+
+CREATE TABLE "ConceptCategories" (
+    "Id" integer GENERATED BY DEFAULT AS IDENTITY,
+    "Name" text NOT NULL,
+    "Description" text,
+    "IsActive" boolean NOT NULL,
+    "ParentId" integer,
+    "IsSystem" boolean NOT NULL DEFAULT FALSE,
+    "OriginSystemId" integer,
+    "OwnerId" text,
+    CONSTRAINT "PK_ConceptCategories" PRIMARY KEY ("Id"),
+    CONSTRAINT "FK_ConceptCategories_ConceptCategories_ParentId" FOREIGN KEY ("ParentId") REFERENCES "ConceptCategories" ("Id") ON DELETE RESTRICT
+);
+
+CREATE TABLE "SportConcepts" (
+    "Id" integer GENERATED BY DEFAULT AS IDENTITY,
+    "Name" text NOT NULL,
+    "Description" text,
+    "Url" text,
+    "ConceptCategoryId" integer,
+    "SportId" integer NOT NULL DEFAULT 0,
+    "IsActive" boolean NOT NULL,
+    "IsSystem" boolean NOT NULL DEFAULT FALSE,
+    "TacticalComplexity" integer NOT NULL DEFAULT 0,
+    "TechnicalDifficulty" integer NOT NULL DEFAULT 0,
+    "DevelopmentLevel" integer,
+    "TechnicalTacticalFocus" integer,
+    "OwnerId" text,
+    "OriginSystemId" integer,
+    CONSTRAINT "PK_SportConcepts" PRIMARY KEY ("Id"),
+    CONSTRAINT "FK_SportConcepts_ConceptCategories_ConceptCategoryId" FOREIGN KEY ("ConceptCategoryId") REFERENCES "ConceptCategories" ("Id"),
+    CONSTRAINT "FK_SportConcepts_Sports_SportId" FOREIGN KEY ("SportId") REFERENCES "Sports" ("Id") ON DELETE CASCADE
+);
+CREATE INDEX "IX_SportConcepts_Name_SportId" ON "SportConcepts" ("Name", "SportId");
@@ -0,0 +1,88 @@
+from apply_seed import group_by_shard, main as apply_main, read_range, scan_batches
+from generate_concepts_seed import (
+    BATCH_MARKER,
+    CHECKPOINT_TABLE,
+    EMITTERS,
+    RETIRED_SHARD,
+    SeedManifest,
+    iter_batches,
+    main as generate_main,
+    parse_rows,
+)
+
+# Two top-level categories, so two shards; 5 + 2 rows in batches of 2.
+CATALOG = [
+    ("Técnica Individual", "Pase", "Pase de pecho"),
+    ("Técnica Individual", "Pase", "Pase picado"),
+    ("Técnica Individual", "Tiro", "Tiro libre"),
+    ("Técnica Individual", "Tiro", "Bandeja"),
+    ("Técnica Individual", "Tiro", "Gancho"),
+    ("Táctica Colectiva", "Ataque", "Pick and roll"),
+    ("Táctica Colectiva", "Ataque", "Puerta atrás"),
+]
+
+
+def generate(catalog_path, output, *args):
+    assert generate_main([catalog_path, "--mode", "set", "--sport", "Baloncesto", "--batch-rows", "2",
+                          "-o", str(output), *args]) == 0
+    return str(output)
+
+
+def test_scan_batches_round_trip(tmp_path, catalog):
+    manifest = tmp_path / "seed.manifest.json"
+    SeedManifest({("Técnica Individual", "Pase", "Pase de béisbol"): "0" * 32}).save(str(manifest))
+    seed = generate(catalog(CATALOG), tmp_path / "seed.sql", "--manifest", str(manifest))
+
+    preamble_end, batches = scan_batches(seed)
+    with open(seed, encoding="utf-8", newline="") as f:
+        text = f.read()
+    pieces = [read_range(seed, 0, preamble_end)] + [read_range(seed, start, end) for _id, _shard, start, end in batches]
+    assert "".join(pieces) == text
+    for batch_id, shard, start, end in batches:
+        text = read_range(seed, start, end)
+        assert text.startswith(f"{BATCH_MARKER}{batch_id} shard={shard}\n")
+        assert text.rstrip().endswith("COMMIT;")
+    assert len({batch_id for batch_id, *_ in batches}) == len(batches)
+
+    shards, retired = group_by_shard(batches)
+    assert [[batch[1] for batch in shard] for shard in shards] == [["Técnica Individual"] * 3,
+                                                                    ["Táctica Colectiva"]]
+    assert [batch[1] for batch in retired] == [RETIRED_SHARD]
+    # Within a shard, batches keep their file order.
+    assert all(shard == sorted(shard, key=lambda batch: batch[2]) for shard in shards)
+
+
+def test_batch_bytes_counts_utf8_bytes(catalog):
+    # 50 characters, 100 bytes: a 100-byte limit closes the batch after every row.
+    path = catalog([("Técnica Individual", "Pase", "ñ" * 50), ("Técnica Individual", "Pase", "ü" * 50)])
+    script = "".join(iter_batches(parse_rows([path]), EMITTERS["set"], batch_rows=10, batch_bytes=100))
+    assert script.count(BATCH_MARKER) == 2
+
+
+def test_resume_after_failed_batch(database, tmp_path, catalog):
+    seed = generate(catalog(CATALOG), tmp_path / "seed.sql")
+    with open(seed, "rb") as f:
+        original = f.read()
+    _preamble_end, batches = scan_batches(seed)
+    shards, _retired = group_by_shard(batches)
+    first, failing, after = shards[0]
+
+    marker = f"{BATCH_MARKER}{failing[0]} shard={failing[1]}\nBEGIN;\n".encode("utf-8")
+    with open(seed, "wb") as f:
+        f.write(original.replace(marker, marker + b"SELECT 1 / 0;\n"))
+    assert apply_main([seed, "--dsn", database.dsn]) == 1
+
+    applied = {batch_id for (batch_id,) in database.query(f'SELECT "BatchId" FROM {CHECKPOINT_TABLE}')}
+    assert applied == {first[0], shards[1][0][0]}
+    assert database.count() == 4
+
+    with open(seed, "wb") as f:
+        f.write(original)
+    assert apply_main([seed, "--dsn", database.dsn]) == 0
+
+    applied = {batch_id for (batch_id,) in database.query(f'SELECT "BatchId" FROM {CHECKPOINT_TABLE}')}
+    assert applied == {batch_id for batch_id, *_ in batches}
+    assert after[0] in applied
+    assert database.count() == len(CATALOG)
+    distinct = database.query('SELECT count(DISTINCT ("Name", "ConceptCategoryId")) FROM "SportConcepts"')
+    assert distinct[0][0] == len(CATALOG)
@@ -0,0 +1,31 @@
+import pytest
+
+from build_seed_bundle import DEFAULT_SPORT, build_shard, main as bundle_main, parse_catalog_args
+
+
+def test_parse_catalog_args_groups_paths_by_sport():
+    assert parse_catalog_args(["a.tsv", "Futbol=b.tsv", " Futbol =c.tsv"]) == {
+        DEFAULT_SPORT: ["a.tsv"], "Futbol": ["b.tsv", "c.tsv"]}
+
+
+def test_parse_catalog_args_refuses_sports_that_only_differ_in_spelling():
+    with pytest.raises(ValueError, match="'Fútbol' and 'futbol'"):
+        parse_catalog_args(["Fútbol=a.tsv", "futbol=b.tsv"])
+
+
+def test_build_shard_returns_a_count_not_the_rows(tmp_path, catalog):
+    path = catalog([("Técnica", "Pase", "Pase de pecho"), ("Técnica", "Pase", "Pase de  PECHO"),
+                    ("Técnica", "Tiro", "Bandeja")])
+    assert build_shard("Futbol", [path], "set", str(tmp_path / "shard.sql")) == ("Futbol", 2, None)
+
+
+def test_bundle_is_independent_of_worker_count(tmp_path, catalog):
+    catalogs = [f"Baloncesto={catalog([('Técnica', 'Pase', 'Pase de pecho')], 'a.tsv')}",
+                f"Futbol={catalog([('Técnica', 'Pase', 'Pase de pecho'), ('Técnica', 'Tiro', 'Volea')], 'b.tsv')}"]
+    outputs = []
+    for jobs in ("1", "2"):
+        output = tmp_path / f"bundle{jobs}.sql"
+        assert bundle_main([*catalogs, "-j", jobs, "-o", str(output)]) == 0
+        outputs.append(output.read_text(encoding="utf-8"))
+    assert outputs[0] == outputs[1]
+    assert "-- Sport: Baloncesto (1 concepts)" in outputs[0] and "-- Sport: Futbol (2 concepts)" in outputs[0]
@@ -0,0 +1,48 @@
+from concept_index import ConceptIndex, build_index, has_importer_rows, stable_id
+from generate_concepts_seed import normalize_key
+
+CATALOG = [
+    ("Técnica Individual", "Pase", "Pase de pecho"),
+    ("Técnica Individual", "Pase", "Pase picado"),
+    ("Técnica Individual", "Pase", "Pase de Pecho"),
+    ("Técnica Individual", "Tiro", "Bandeja"),
+    ("Táctica Colectiva", "Ataque", "Bandeja"),
+]
+
+
+def _tag(subcategory, name):
+    return stable_id((normalize_key(subcategory), normalize_key(name)))
+
+
+def test_lookup_and_resolve(tmp_path, catalog):
+    path = str(tmp_path / "concept_index.tsv")
+    build_index([catalog(CATALOG)], path)
+    with ConceptIndex(path) as index:
+        assert index.verify()
+        assert index.meta["concepts"] == "4"
+        tag = _tag("Pase", "Pase de pecho")
+        assert index.lookup("t:" + tag) == [("Pase", "Pase de pecho")]
+        # Tags are case-insensitive hex; spelling variants resolve to the kept spelling.
+        assert index.resolve(tag.upper()) == [("Pase", "Pase de pecho")]
+        assert index.resolve(" PASE DE PÉCHO ") == [("Pase", "Pase de pecho")]
+        assert index.resolve("bandeja") == [("Ataque", "Bandeja"), ("Tiro", "Bandeja")]
+        assert index.resolve("No existe") == []
+        # Row tags only come from the importer's CSV.
+        assert index.resolve("1") == []
+
+
+def test_row_tags_from_the_importer_csv(tmp_path):
+    csv = tmp_path / "Conceptos.csv"
+    csv.write_text("Categoria,Subcategoria,Concepto\n"
+                   "Técnica Individual,Pase,Pase de pecho\n"
+                   "Técnica Individual,Pase,Pase de Pecho\n"
+                   "Técnica Individual,Tiro,Bandeja\n", encoding="utf-8")
+    assert has_importer_rows([str(csv)])
+    assert not has_importer_rows([str(csv), str(csv)])
+    path = str(tmp_path / "concept_index.tsv")
+    build_index([str(csv)], path)
+    with ConceptIndex(path) as index:
+        # A duplicate row keeps its own number and points at the kept concept.
+        assert index.resolve("2") == [("Pase", "Pase de pecho")]
+        assert index.resolve("3") == [("Tiro", "Bandeja")]
+        assert index.resolve("4") == []
@@ -0,0 +1,165 @@
+import argparse
+import json
+
+import pytest
+
+from generate_concepts_seed import (
+    ManifestDiff,
+    SeedManifest,
+    SeedRow,
+    clean_field,
+    commit_manifest,
+    dedupe,
+    file_sha256,
+    iter_do_block,
+    normalize_key,
+    parse_column,
+    parse_rows,
+    read_records,
+    row_hash,
+    sql_literal,
+)
+
+
+def test_normalize_key_folds_case_accents_and_spaces():
+    assert normalize_key("Juego sin  Balón") == "juego sin balon"
+    assert normalize_key("  PASE\tPicado ") == "pase picado"
+    assert normalize_key("Ñandú") == "nandu"
+
+
+def test_sql_literal_escapes_quotes():
+    assert sql_literal("Se conoce como 'pick and roll'") == "'Se conoce como ''pick and roll'''"
+    assert sql_literal(None) == "NULL"
+
+
+def test_clean_field_collapses_line_breaks():
+    assert clean_field(" Pase\r\nde pecho;\n  DROP ") == "Pase de pecho; DROP"
+
+
+def test_do_block_is_not_ended_by_catalog_text(catalog):
+    from seed_stats import split_statements
+
+    path = catalog([("Técnica", "Pase", "Pase $$; DROP TABLE x; $$", "Ver $$; DROP TABLE y; $$")])
+    script = "".join(iter_do_block(parse_rows([path])))
+    statements = split_statements(script)
+    assert len(statements) == 1 and statements[0].startswith("DO $seed$")
+    assert "'Pase $$; DROP TABLE x; $$'" in script
+
+    path = catalog([("Técnica", "Pase", "Pase $seed$; DROP TABLE x; --")], "tagged.tsv")
+    with pytest.raises(ValueError, match="would end the DO block"):
+        "".join(iter_do_block(parse_rows([path])))
+
+
+def test_dedupe_keeps_first_spelling_and_records_variants():
+    rows = [SeedRow("Táctica", "Juego sin balón", "Corte"), SeedRow("Táctica", "Juego sin balon", "corte"),
+            SeedRow("Táctica", "Juego sin balón", "Corte"), SeedRow("Táctica", "Juego sin balón", "Puerta atrás")]
+    variants = []
+    kept = list(dedupe(rows, variants))
+    assert [row.key for row in kept] == [("Juego sin balón", "Corte"), ("Juego sin balón", "Puerta atrás")]
+    # Exact repeats are dropped silently; only spelling variants are recorded.
+    assert variants == [(("Juego sin balón", "Corte"), ("Juego sin balon", "corte"))]
+
+
+def test_dedupe_without_variants_list_drops_the_same_rows():
+    rows = [SeedRow("Táctica", "Juego sin balón", "Corte"), SeedRow("Táctica", "Juego sin balon", "corte"),
+            SeedRow("Táctica", "Juego sin balón", "Puerta atrás"), SeedRow("Táctica", "Juego sin balón x", "Corte")]
+    assert [row.key for row in dedupe(rows)] == [row.key for row in dedupe(rows, [])] == [
+        ("Juego sin balón", "Corte"), ("Juego sin balón", "Puerta atrás"), ("Juego sin balón x", "Corte")]
+
+
+def test_read_records_numbers_lines_across_files(tmp_path):
+    tsv = tmp_path / "a.tsv"
+    tsv.write_text("Técnica\tPase\tPase de pecho\t-\t-\nshort line\nTécnica\tTiro\tBandeja\t-\t-\n", encoding="utf-8")
+    csv = tmp_path / "b.csv"
+    csv.write_text('Categoria,Subcategoria,Concepto,Descripcion,URL\n'
+                   'Técnica,Pase,"Pase\npicado",,\n'
+                   'Técnica,Tiro,Gancho,,\n', encoding="utf-8")
+    numbers = [(record[2], record[5]) for record in read_records([str(tsv), str(csv)])]
+    # The quoted newline makes "Pase picado" two lines long, so "Gancho" starts on the CSV's line 3.
+    assert numbers == [("Pase de pecho", 1), ("Bandeja", 3), ("Pase\npicado", 4), ("Gancho", 6)]
+
+
+def test_parse_rows_drops_placeholders(catalog):
+    path = catalog([("Técnica", "Pase", "(Sin conceptos específicos)"),
+                    ("Técnica", "Pase", "Pase de pecho"),
+                    ("Técnica", "Pase", "Pase picado", "Pase que bota una vez", "https://youtu.be/abc")])
+    rows = list(parse_rows([path]))
+    assert [(row.name, row.description, row.url) for row in rows] == [
+        ("Pase de pecho", None, None),
+        ("Pase picado", "Pase que bota una vez", "https://youtu.be/abc"),
+    ]
+
+
+def test_parse_column():
+    assert parse_column("IsSystem=true") == ("IsSystem", True)
+    assert parse_column("IsSystem=False") == ("IsSystem", False)
+    assert parse_column("TacticalComplexity=-2") == ("TacticalComplexity", -2)
+    assert parse_column("OwnerId=seed=1") == ("OwnerId", "seed=1")
+    for text in ("IsSystem", "Is System=true", '"x"=1', "SportId=1"):
+        with pytest.raises(argparse.ArgumentTypeError):
+            parse_column(text)
+
+
+def _diff(previous, rows, sport=None):
+    diff = ManifestDiff(previous, sport)
+    changed = list(diff.changed(rows))
+    return diff, changed
+
+
+def test_manifest_diff_reports_inserted_updated_unchanged_and_retired():
+    first, _ = _diff(SeedManifest(), [SeedRow("Técnica", "Pase", "Pase de pecho"),
+                                      SeedRow("Técnica", "Pase", "Pase picado"),
+                                      SeedRow("Técnica", "Tiro", "Bandeja")])
+    diff, changed = _diff(first.current, [SeedRow("Técnica", "Pase", "Pase de pecho"),
+                                          SeedRow("Técnica", "Pase", "Pase picado", "Bota una vez"),
+                                          SeedRow("Técnica", "Tiro", "Gancho")])
+    assert [row.name for row in changed] == ["Pase picado", "Gancho"]
+    assert (diff.inserted, diff.updated, diff.unchanged) == (1, 1, 1)
+    assert diff.retired() == [("Técnica", "Tiro", "Bandeja")]
+
+
+def test_manifest_diff_moving_a_concept_is_a_retirement_and_an_insert():
+    first, _ = _diff(SeedManifest(), [SeedRow("Técnica Individual", "Poste bajo", "Giro")])
+    diff, changed = _diff(first.current, [SeedRow("Táctica Individual", "Poste bajo", "Giro")])
+    assert [row.category for row in changed] == ["Táctica Individual"]
+    assert (diff.inserted, diff.updated) == (1, 0)
+    assert diff.retired() == [("Técnica Individual", "Poste bajo", "Giro")]
+
+
+def test_row_hash_covers_the_sport():
+    assert row_hash(SeedRow("Técnica", "Pase", "Pase", sport="Baloncesto")) != \
+        row_hash(SeedRow("Técnica", "Pase", "Pase", sport="Futbol"))
+
+
+def test_manifest_round_trip(tmp_path):
+    path = str(tmp_path / "seed.manifest.json")
+    manifest = SeedManifest({("Técnica", "Pase", "Pase de pecho"): "a" * 32, ("", "Pase", "Pase picado"): "b" * 32})
+    manifest.save(path)
+    assert SeedManifest.load(path).rows == manifest.rows
+    assert SeedManifest.load(str(tmp_path / "missing.json")).rows == {}
+
+
+def test_manifest_v1_is_refused(tmp_path):
+    path = tmp_path / "seed.manifest.json"
+    path.write_text(json.dumps({"version": 1, "rows": [["Pase", "Pase de pecho", "a" * 32]]}), encoding="utf-8")
+    with pytest.raises(ValueError, match="version 1"):
+        SeedManifest.load(str(path))
+
+
+def test_commit_manifest_needs_the_script_it_was_generated_with(tmp_path):
+    path = str(tmp_path / "seed.manifest.json")
+    script = tmp_path / "seed.sql"
+    script.write_text("SELECT 1;\n", encoding="utf-8")
+    other = tmp_path / "other.sql"
+    other.write_text("SELECT 2;\n", encoding="utf-8")
+    assert not commit_manifest(path, str(script))
+
+    manifest = SeedManifest({("Técnica", "Pase", "Pase de pecho"): "a" * 32})
+    manifest.save(path + SeedManifest.PENDING_SUFFIX, file_sha256(str(script)))
+    with pytest.raises(ValueError):
+        commit_manifest(path, str(other))
+    assert SeedManifest.load(path).rows == {}
+
+    assert commit_manifest(path, str(script))
+    assert SeedManifest.load(path).rows == manifest.rows
+    assert not (tmp_path / ("seed.manifest.json" + SeedManifest.PENDING_SUFFIX)).exists()
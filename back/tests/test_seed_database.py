@@ -0,0 +1,152 @@
+import os
+
+import pytest
+
+from apply_seed import main as apply_main
+from generate_concepts_seed import HERE, main as generate_main
+
+# Runs against PostgreSQL: every test needs the database fixture (SEED_TEST_DATABASE_URL).
+
+CATALOG = [
+    ("Técnica Individual", "Pase", "Pase de pecho", "Pase con las dos manos desde el pecho"),
+    ("Técnica Individual", "Pase", "Pase picado"),
+    ("Técnica Individual", "Tiro", "Bandeja"),
+    ("Táctica Colectiva", "Bloqueo directo", "Pick and roll", "Se conoce como 'pick and roll'"),
+    ("Táctica Colectiva", "Bloqueo directo", "Pick and pop"),
+]
+
+
+def generate(catalog_path, output, *args):
+    assert generate_main([catalog_path, "--sport", "Baloncesto", "-o", str(output), *args]) == 0
+    return str(output)
+
+
+def apply(database, seed, *args):
+    return apply_main([seed, "--dsn", database.dsn, *args])
+
+
+def concepts(database, sport="Baloncesto"):
+    """{(parent, subcategory, name): (description, active)} for one sport."""
+    rows = database.query(
+        'SELECT p."Name", c."Name", s."Name", s."Description", s."IsActive" FROM "SportConcepts" s '
+        'JOIN "ConceptCategories" c ON c."Id" = s."ConceptCategoryId" '
+        'LEFT JOIN "ConceptCategories" p ON p."Id" = c."ParentId" '
+        f'JOIN "Sports" sp ON sp."Id" = s."SportId" WHERE sp."Name" = \'{sport}\'')
+    return {(parent, subcategory, name): (description, active) for parent, subcategory, name, description, active in rows}
+
+
+@pytest.mark.parametrize("mode", ["do", "set"])
+def test_full_script_is_idempotent(database, tmp_path, catalog, mode):
+    assert apply(database, os.path.join(HERE, "seed_categories.sql")) == 0
+    seed = generate(catalog(CATALOG), tmp_path / "seed.sql", "--mode", mode)
+    assert apply(database, seed) == 0
+    assert apply(database, seed) == 0
+    seeded = concepts(database)
+    assert set(seeded) == {(category, subcategory, name) for category, subcategory, name, *_ in CATALOG}
+    assert seeded[("Táctica Colectiva", "Bloqueo directo", "Pick and roll")] == ("Se conoce como 'pick and roll'", True)
+    assert database.count() == len(CATALOG)
+
+
+@pytest.mark.parametrize("mode", ["do", "set"])
+def test_dollar_quotes_in_catalog_text_stay_text(database, tmp_path, catalog, mode):
+    database.query("DROP TABLE IF EXISTS x; CREATE TABLE x (id integer)")
+    name = "Pase $$; DROP TABLE x; $$"
+    rows = [("Técnica Individual", "Pase", name, "$body$ -- $$")]
+    assert apply(database, os.path.join(HERE, "seed_categories.sql")) == 0
+    assert apply(database, generate(catalog(rows), tmp_path / "seed.sql", "--mode", mode)) == 0
+    assert concepts(database) == {("Técnica Individual", "Pase", name): ("$body$ -- $$", True)}
+    assert database.query("SELECT to_regclass('x') IS NOT NULL") == [(True,)]
+    database.query("DROP TABLE x")
+
+
+def test_do_script_resolves_categories_under_their_parent(database, tmp_path, catalog):
+    # An older top-level "Tiro" comes first by Id; the concept belongs under its parent.
+    database.query('INSERT INTO "ConceptCategories" ("Name", "IsActive") VALUES (\'Tiro\', true)')
+    assert apply(database, os.path.join(HERE, "seed_categories.sql")) == 0
+    assert apply(database, generate(catalog(CATALOG), tmp_path / "seed.sql", "--mode", "do")) == 0
+    assert ("Técnica Individual", "Tiro", "Bandeja") in concepts(database)
+
+    missing = catalog(CATALOG + [("Estrategia", "Saques de fondo", "Saque en caja")], "missing.tsv")
+    with pytest.raises(Exception, match="Unknown category: Estrategia / Saques de fondo"):
+        apply(database, generate(missing, tmp_path / "missing.sql", "--mode", "do"))
+
+
+def test_shipped_seed_applies_every_catalog_concept(database):
+    from generate_concepts_seed import DEFAULT_INPUT, parse_rows
+
+    assert apply(database, os.path.join(HERE, "seed_categories.sql")) == 0
+    assert apply(database, os.path.join(HERE, "seed_concepts.sql")) == 0
+    assert database.count() == sum(1 for _row in parse_rows([DEFAULT_INPUT]))
+
+
+def test_set_script_builds_the_category_tree(database, tmp_path, catalog):
+    seed = generate(catalog(CATALOG + [("Estrategia", "Saques de fondo", "Saque en caja")]), tmp_path / "seed.sql",
+                    "--mode", "set")
+    assert apply(database, seed) == 0
+    assert ("Estrategia", "Saques de fondo", "Saque en caja") in concepts(database)
+    assert database.query('SELECT count(*) FROM "ConceptCategories" WHERE "ParentId" IS NULL')[0][0] == 3
+
+
+def test_same_concepts_for_two_sports(database, tmp_path, catalog):
+    path = catalog(CATALOG)
+    assert apply(database, generate(path, tmp_path / "baloncesto.sql", "--mode", "set")) == 0
+    assert generate_main([path, "--mode", "set", "--sport", "Futbol", "-o", str(tmp_path / "futbol.sql")]) == 0
+    assert apply(database, str(tmp_path / "futbol.sql")) == 0
+    assert len(concepts(database)) == len(concepts(database, "Futbol")) == len(CATALOG)
+
+
+@pytest.mark.parametrize("mode", ["do", "set"])
+def test_extra_columns(database, tmp_path, catalog, mode):
+    assert apply(database, os.path.join(HERE, "seed_categories.sql")) == 0
+    seed = generate(catalog(CATALOG), tmp_path / "seed.sql", "--mode", mode,
+                    "--column", "IsSystem=true", "--column", "TacticalComplexity=2", "--column", "OwnerId=seed")
+    assert apply(database, seed) == 0
+    assert database.query('SELECT DISTINCT "IsSystem", "TacticalComplexity", "OwnerId" FROM "SportConcepts"') == [
+        (True, 2, "seed")]
+    assert database.count() == len(CATALOG)
+
+
+def test_unknown_sport_fails(database, tmp_path, catalog):
+    assert generate_main([catalog(CATALOG), "--mode", "set", "--sport", "Rugby", "-o", str(tmp_path / "seed.sql")]) == 0
+    with pytest.raises(Exception, match="Unknown sport"):
+        apply(database, str(tmp_path / "seed.sql"))
+    assert database.count() == 0
+
+
+@pytest.mark.parametrize("batched", [False, True])
+def test_delta_updates_moves_and_retires(database, tmp_path, catalog, batched):
+    manifest = str(tmp_path / "seed.manifest.json")
+    batch_args = ["--batch-rows", "2"] if batched else []
+    # Futbol shares the concepts; Baloncesto deltas must leave it alone.
+    generate_main([catalog(CATALOG), "--mode", "set", "--sport", "Futbol", "-o", str(tmp_path / "futbol.sql")])
+    assert apply(database, str(tmp_path / "futbol.sql")) == 0
+
+    first = generate(catalog(CATALOG), tmp_path / "first.sql", "--manifest", manifest, *batch_args)
+    assert not os.path.exists(manifest)
+    assert apply(database, first, "--manifest", manifest) == 0
+    assert os.path.exists(manifest)
+    assert len(concepts(database)) == len(CATALOG)
+
+    edited = [
+        ("Técnica Individual", "Pase", "Pase de pecho", "Pase con las dos manos, extendiendo los brazos"),
+        ("Técnica Individual", "Pase", "Pase picado"),
+        # Moved to another parent: the old row is retired and a new one inserted.
+        ("Táctica Individual", "Tiro", "Bandeja"),
+        ("Táctica Colectiva", "Bloqueo directo", "Pick and roll", "Se conoce como 'pick and roll'"),
+    ]
+    second = generate(catalog(edited, "edited.tsv"), tmp_path / "second.sql", "--manifest", manifest, *batch_args)
+    assert apply(database, second, "--manifest", manifest) == 0
+
+    seeded = concepts(database)
+    assert seeded[("Técnica Individual", "Pase", "Pase de pecho")] == (
+        "Pase con las dos manos, extendiendo los brazos", True)
+    assert seeded[("Técnica Individual", "Pase", "Pase picado")] == (None, True)
+    assert seeded[("Técnica Individual", "Tiro", "Bandeja")] == (None, False)
+    assert seeded[("Táctica Individual", "Tiro", "Bandeja")] == (None, True)
+    assert seeded[("Táctica Colectiva", "Bloqueo directo", "Pick and pop")] == (None, False)
+    assert all(active for _description, active in concepts(database, "Futbol").values())
+
+    # The manifest now matches the database, so the next delta is empty.
+    generate(catalog(edited, "edited.tsv"), tmp_path / "third.sql", "--manifest", manifest)
+    assert "No inserted or updated concepts" in (tmp_path / "third.sql").read_text(encoding="utf-8")
+    assert "No retired concepts" in (tmp_path / "third.sql").read_text(encoding="utf-8")
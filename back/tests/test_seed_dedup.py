@@ -0,0 +1,54 @@
+import json
+
+from generate_concepts_seed import SeedRow
+from seed_dedup import NUM_BINS, NearDuplicateIndex, build_report, load_accepted, minhash_signature, ngrams
+
+
+def test_minhash_signature_is_deterministic_and_dense():
+    grams = ngrams("pase de pecho")
+    signature = minhash_signature(grams)
+    assert signature == minhash_signature(set(grams))
+    assert len(signature) == NUM_BINS
+    # A single gram fills one bin; densification fills the rest from it.
+    sparse = minhash_signature({"abc"})
+    assert None not in sparse
+    assert len(set(sparse)) == NUM_BINS
+
+
+def test_similar_names_share_more_bins():
+    a = minhash_signature(ngrams("bloqueo directo central"))
+    b = minhash_signature(ngrams("bloqueo directo centrado"))
+    c = minhash_signature(ngrams("tiro libre"))
+    assert sum(x == y for x, y in zip(a, b)) > sum(x == y for x, y in zip(a, c))
+
+
+def _index(rows):
+    index = NearDuplicateIndex()
+    for row in index.stage(rows):
+        pass
+    return index
+
+
+def test_near_duplicates_within_a_subcategory():
+    index = _index([SeedRow("Táctica", "Ataque", "Bloqueo directo central"),
+                    SeedRow("Táctica", "Ataque", "Bloqueo directo centra"),
+                    SeedRow("Táctica", "Defensa", "Bloqueo directo central"),
+                    SeedRow("Táctica", "Ataque", "Tiro libre")])
+    assert [(a, b) for _score, a, b in index.pairs()] == [
+        (("Ataque", "Bloqueo directo central"), ("Ataque", "Bloqueo directo centra"))]
+
+
+def test_accepted_pairs_are_left_out_of_the_report(tmp_path):
+    index = _index([SeedRow("Técnica", "Poste bajo", "Centro + fondo"),
+                    SeedRow("Técnica", "Poste bajo", "Fondo + centro")])
+    variants = [(("Pase", "Pase de pecho"), ("Pase", "Pase de Pecho"))]
+    report = build_report(variants, index)
+    assert len(report["variants"]) == 1 and len(report["near_duplicates"]) == 1
+
+    accepted = tmp_path / "accepted.json"
+    # Either order of a pair is accepted.
+    accepted.write_text(json.dumps({"near_duplicates": [{"a": ["Poste bajo", "Fondo + centro"],
+                                                         "b": ["Poste bajo", "Centro + fondo"]}]}), encoding="utf-8")
+    report = build_report(variants, index, load_accepted(str(accepted)))
+    assert report["near_duplicates"] == [] and len(report["variants"]) == 1
+    assert load_accepted(str(tmp_path / "missing.json")) == set()
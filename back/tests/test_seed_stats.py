@@ -0,0 +1,56 @@
+import io
+
+from seed_stats import PipelineStats, split_statements
+
+
+def test_split_statements_on_top_level_semicolons():
+    sql = ("BEGIN;\n"
+           "INSERT INTO t VALUES ('a;b', 'it''s; fine');\n"
+           "-- a comment; not a statement\n"
+           'SELECT "odd;name" FROM t;\n'
+           "DO $$ BEGIN PERFORM 1; PERFORM 2; END $$;\n"
+           "DO $body$ BEGIN RAISE NOTICE '$$;'; END $body$;\n"
+           "COMMIT")
+    statements = [statement.strip() for statement in split_statements(sql)]
+    assert statements == [
+        "BEGIN;",
+        "INSERT INTO t VALUES ('a;b', 'it''s; fine');",
+        '-- a comment; not a statement\nSELECT "odd;name" FROM t;',
+        "DO $$ BEGIN PERFORM 1; PERFORM 2; END $$;",
+        "DO $body$ BEGIN RAISE NOTICE '$$;'; END $body$;",
+        "COMMIT",
+    ]
+
+
+def test_split_statements_drops_comment_only_pieces():
+    assert split_statements("-- nothing here;\n\n") == []
+    assert split_statements("SELECT 1;\n-- trailing comment\n") == ["SELECT 1;"]
+
+
+def test_pipeline_stats_counts_items_per_stage():
+    stats = PipelineStats()
+    stats.start()
+    read = stats.stage("read", range(10))
+    kept = stats.stage("keep", (value for value in read if value % 2))
+    assert list(kept) == [1, 3, 5, 7, 9]
+    stats.stop()
+    assert (stats.items("read"), stats.items("keep"), stats.items("missing")) == (10, 5, 0)
+    assert [stage["name"] for stage in stats.report()["stages"]] == ["read", "keep", "other"]
+
+
+def test_top_allocations_are_taken_while_the_stages_hold_memory():
+    def hoard(items):
+        held = []
+        for item in items:
+            held.append(bytearray(100_000))
+            yield item
+
+    stats = PipelineStats(trace_memory=True)
+    stats.start()
+    out = stats.writer(io.StringIO())
+    for item in stats.stage("hoard", hoard(range(50))):
+        out.write(str(item))
+    stats.stop()
+    # The stage's 5 MB is freed by the time stop() runs, yet it still tops the report.
+    assert stats.memory["traced_current_bytes"] < 1_000_000 < stats.memory["top_allocations_at_bytes"]
+    assert "test_seed_stats.py" in stats.memory["top_allocations"][0]["where"]
@@ -1,31 +1,16 @@
-import re
-
-file_path = r'c:\Proyectos\SportPlanner\back\seed_concepts.sql'
-
-with open(file_path, 'r', encoding='utf-8') as f:
-    content = f.read()
-
-# 1. Add v_sport_id to DECLARE
-content = content.replace('    v_cat_id INT;', '    v_cat_id INT;\n    v_sport_id INT;')
-
-# 2. Initialize v_sport_id
-content = content.replace('BEGIN', "BEGIN\n    SELECT \"Id\" INTO v_sport_id FROM \"Sports\" WHERE \"Name\" = 'Baloncesto' LIMIT 1;")
-
-# 3. Update INSERT statements
-content = content.replace(
-    'INSERT INTO "SportConcepts" ("Name", "Description", "Url", "ConceptCategoryId", "IsActive")',
-    'INSERT INTO "SportConcepts" ("Name", "Description", "Url", "ConceptCategoryId", "IsActive", "SportId")'
-)
-
-# 4. Update SELECT statements
-# This regex looks for the pattern ending in ", true" and appends ", v_sport_id"
-# We need to be careful not to match other things.
-# The lines look like: SELECT '...', '...', '...', v_cat_id, true
-# We can replace ", true\n" with ", true, v_sport_id\n"
-
-content = re.sub(r', true\n', ', true, v_sport_id\n', content)
-
-with open(file_path, 'w', encoding='utf-8') as f:
-    f.write(content)
-
-print("Updated seed_concepts.sql")
+import os
+import sys
+
+from generate_concepts_seed import HERE, main
+
+# The sport used to be added by rewriting the generated SQL text; it is now
+# the attach_sport stage of the generator, resolved once per batch.
+# Extra arguments (e.g. --mode set, or other input files) are passed through.
+file_path = os.path.join(HERE, "seed_concepts.sql")
+# The exercise importer resolves concept tags through this index.
+index_path = os.path.join(HERE, "concept_index.tsv")
+
+status = main(["--sport", "Baloncesto", "--index", index_path, "-o", file_path] + sys.argv[1:])
+if status == 0:
+    print("Updated seed_concepts.sql")
+sys.exit(status)